@@ -3,13 +3,16 @@
 Main client application for Prospector game
 """
 import curses
+import os
+import selectors
 import sys
 import time
 from client.ui import GameUI
 from client.network import NetworkClient
 from common.protocol import (
-    create_game_message, join_game_message, 
-    place_fence_message, leave_game_message, get_stats_message
+    create_game_message, join_game_message,
+    place_fence_message, leave_game_message, get_stats_message,
+    get_game_state_message
 )
 
 class ProspectorClient:
@@ -27,6 +30,9 @@ class ProspectorClient:
         self.running = False
         self.menu_position = 0
         self.menu_options = ["Create a new game", "Join a game", "View statistics", "Quit"]
+        # Player id -> index map, rebuilt once per game_state update so cell
+        # owners resolve in O(1) instead of scanning the players list
+        self._owner_index = {}
     
     def start(self):
         """Start the client application"""
@@ -48,41 +54,72 @@ class ProspectorClient:
             
             # Main game loop
             self.running = True
+            # Sleep in a selector on stdin and the network wake pipe, so the
+            # loop only runs when a key arrives or the receiver posts a wakeup.
+            # getch() itself never blocks.
+            selector = selectors.DefaultSelector()
+            selector.register(sys.stdin, selectors.EVENT_READ)
+            selector.register(self.network.wake_fd, selectors.EVENT_READ)
+            self.ui.set_input_timeout(0)
+            dirty = True  # Whether the screen needs to be redrawn
+            last_view = None  # Which view ('game' or 'menu') was drawn last
             while self.running:
-                self.ui.clear()
-                self.ui.display_header()
-                
+                # Redraw when a server update arrived since the last frame
+                if self.network.update_event.is_set():
+                    self.network.update_event.clear()
+                    dirty = True
+
+                if dirty:
+                    # Only wipe the whole screen when switching views; otherwise
+                    # draw in place and let the grid diff skip unchanged cells
+                    view = 'game' if self.game_state else 'menu'
+                    if view != last_view:
+                        self.ui.clear()
+                        last_view = view
+                    self.ui.display_header()
+
+                    if self.game_state:
+                        self.ui.display_game(self.game_state)
+                    else:
+                        # Display menu
+                        self.menu_position = self.ui.display_menu(self.menu_position, self.menu_options)
+
+                    self.ui.display_messages()
+                    self.ui.refresh()
+                    dirty = False
+
+                # Block until a key or a server update arrives (0.5 s safety timeout)
+                for key_event, _ in selector.select(timeout=0.5):
+                    if key_event.fd == self.network.wake_fd:
+                        os.read(self.network.wake_fd, 4096)  # Drain the wake pipe
+
                 if self.game_state:
-                    self.ui.display_game(self.game_state)
                     action = self.ui.handle_input(self.game_state)
-                    
-                    if action:
-                        if action['action'] == 'quit':
-                            if self.game_id:
-                                self.network.send_message(leave_game_message(self.game_id))
-                                self.game_id = None
-                                self.game_state = None
-                        elif action['action'] == 'place_fence':
-                            if self.game_id:
-                                action['game_id'] = self.game_id
-                                self.network.send_message(action)
+
+                    if action is not None:
+                        dirty = True
+                        if isinstance(action, dict):
+                            if action['action'] == 'quit':
+                                if self.game_id:
+                                    self.network.send_message(leave_game_message(self.game_id))
+                                    self.game_id = None
+                                    self.game_state = None
+                            elif action['action'] == 'place_fence':
+                                if self.game_id:
+                                    action['game_id'] = self.game_id
+                                    self.network.send_message(action)
                 else:
-                    # Display menu
-                    self.menu_position = self.ui.display_menu(self.menu_position, self.menu_options)
                     key = self.ui.handle_input()
-                    
-                    if key == curses.KEY_UP:
-                        self.menu_position = max(0, self.menu_position - 1)
-                    elif key == curses.KEY_DOWN:
-                        self.menu_position = min(len(self.menu_options) - 1, self.menu_position + 1)
-                    elif key == 10:  # Enter key
-                        self.handle_menu_selection(self.menu_position)
-                
-                self.ui.display_messages()
-                self.ui.refresh()
-                
-                time.sleep(0.05)  # Small delay to reduce CPU usage
-                
+
+                    if key is not None:
+                        dirty = True
+                        if key == curses.KEY_UP:
+                            self.menu_position = max(0, self.menu_position - 1)
+                        elif key == curses.KEY_DOWN:
+                            self.menu_position = min(len(self.menu_options) - 1, self.menu_position + 1)
+                        elif key == 10:  # Enter key
+                            self.handle_menu_selection(self.menu_position)
+
         except Exception as e:
             self.ui.add_message(f"Error: {e}", 3)
             time.sleep(2)
@@ -166,7 +203,10 @@ class ProspectorClient:
             if 'game_state' in message:
                 self.game_state = message['game_state']
                 self.game_id = message['game_state']['game_id']
+                self._owner_index = {p['id']: i for i, p in enumerate(self.game_state['players'])}
                 self.ui.add_message(message.get('message', 'Game updated'), 2)
+            elif 'delta' in message:
+                self._apply_delta(message['delta'])
             elif 'stats' in message:
                 stats = message['stats']
                 self.ui.add_message(f"Player: {stats['name']}", 2)
@@ -174,6 +214,55 @@ class ProspectorClient:
             else:
                 self.ui.add_message(message.get('message', 'Success'), 2)
 
+    # Cell keys a delta may update
+    _DELTA_CELL_KEYS = ('north', 'east', 'south', 'west', 'owner', 'type')
+
+    def _apply_delta(self, delta):
+        """Apply an incremental game-state update sent in place of a full snapshot
+
+        A fence placement changes at most a couple of cells, so the server can
+        send just those cells plus score and turn updates instead of the whole
+        grid. Deltas carry a version number; if one is missed, the client asks
+        for a full snapshot to resync.
+        """
+        state = self.game_state
+        if not state:
+            return
+
+        # Detect a missed delta and fall back to a full resync
+        version = delta.get('version')
+        if version is not None:
+            if version != state.get('version', 0) + 1:
+                self.network.send_message(get_game_state_message(self.game_id))
+                return
+            state['version'] = version
+
+        # Update the changed cells in place
+        grid = state['grid']
+        for cell_update in delta.get('changed_cells', []):
+            cell = grid[cell_update['y']][cell_update['x']]
+            for key in self._DELTA_CELL_KEYS:
+                if key in cell_update:
+                    cell[key] = cell_update[key]
+
+        # Scores, turn and end-of-game updates
+        score_updates = delta.get('score_updates', {})
+        if score_updates:
+            for player in state['players']:
+                if player['id'] in score_updates:
+                    player['score'] = score_updates[player['id']]
+        if 'current_player_index' in delta:
+            state['current_player_index'] = delta['current_player_index']
+        if 'game_over' in delta:
+            state['game_over'] = delta['game_over']
+        if 'winner' in delta:
+            state['winner'] = delta['winner']
+
+        # Update the UI's packed grid directly; only repack everything if it
+        # has not rendered this game yet
+        if not self.ui.apply_cell_updates(delta.get('changed_cells', []), self._owner_index):
+            self.ui.grid_updated()
+
     def draw_grid(self, start_y, start_x):
         """Draw the game grid"""
         if not self.game_state or 'grid' not in self.game_state:
@@ -215,12 +304,10 @@ class ProspectorClient:
                 cell_color = land_type_colors.get(cell.get('type', 'regular'), 1)
                 
                 if cell.get('owner') is not None:
-                    # Find owner in players list
-                    for i, player in enumerate(self.game_state['players']):
-                        if player['id'] == cell['owner']:
-                            cell_color = 4 if i == 0 else 5
-                            cell_content = 'A' if i == 0 else 'B'
-                            break
+                    # Look up the owner's index directly
+                    i = self._owner_index.get(cell['owner'], 0)
+                    cell_color = 4 if i == 0 else 5
+                    cell_content = 'A' if i == 0 else 'B'
                 else:
                     # Show land type indicator if not owned
                     if cell.get('type') == 'copper':
@@ -0,0 +1,110 @@
+"""
+Pure integer grid operations for the Prospector client
+
+These helpers work on the packed grid representation — parallel int grids
+holding a fence bitmask, an owner index and a land-type index per cell — so
+the render path never touches per-cell dicts.
+"""
+
+# Fence bit positions in the packed per-cell mask
+FENCE_NORTH = 1
+FENCE_EAST = 2
+FENCE_SOUTH = 4
+FENCE_WEST = 8
+
+# Land types mapped to small indices
+TYPE_INDEX = {'regular': 0, 'copper': 1, 'gold': 2}
+
+def pack_grid(grid, players):
+    """Pack the dict grid into parallel int grids (fences, owners, types)
+
+    Each fence mask packs north/east/south/west into one int, the owner is
+    the player's index in the players list (-1 when unowned) and the type is
+    a small index. Built once per game_state update so drawing avoids four
+    dict lookups per cell per frame.
+    """
+    owner_index = {p['id']: i for i, p in enumerate(players)}
+    fences = []
+    owners = []
+    types = []
+    for row in grid:
+        fence_row = []
+        owner_row = []
+        type_row = []
+        for cell in row:
+            mask = 0
+            if cell.get('north'):
+                mask |= FENCE_NORTH
+            if cell.get('east'):
+                mask |= FENCE_EAST
+            if cell.get('south'):
+                mask |= FENCE_SOUTH
+            if cell.get('west'):
+                mask |= FENCE_WEST
+            fence_row.append(mask)
+            owner_row.append(owner_index.get(cell.get('owner'), -1))
+            type_row.append(TYPE_INDEX.get(cell.get('type'), 0))
+        fences.append(fence_row)
+        owners.append(owner_row)
+        types.append(type_row)
+    return fences, owners, types
+
+def apply_cell_updates(packed, cell_updates, owner_index):
+    """Return a new packed grid with the given delta cell updates applied
+
+    Rows are copied on write, so a previous frame still holding the old
+    packed grid keeps its values — the renderer diffs the two to find what
+    to redraw. Updates use the same cell dicts the wire protocol carries.
+    """
+    fences, owners, types = packed
+    fences = list(fences)
+    owners = list(owners)
+    types = list(types)
+    touched_rows = set()
+    for update in cell_updates:
+        y, x = update['y'], update['x']
+        if y not in touched_rows:
+            fences[y] = fences[y][:]
+            owners[y] = owners[y][:]
+            types[y] = types[y][:]
+            touched_rows.add(y)
+        mask = fences[y][x]
+        for key, bit in (('north', FENCE_NORTH), ('east', FENCE_EAST),
+                         ('south', FENCE_SOUTH), ('west', FENCE_WEST)):
+            if key in update:
+                mask = mask | bit if update[key] else mask & ~bit
+        fences[y][x] = mask
+        if 'owner' in update:
+            owners[y][x] = owner_index.get(update['owner'], -1)
+        if 'type' in update:
+            types[y][x] = TYPE_INDEX.get(update['type'], 0)
+    return fences, owners, types
+
+def diff_grids(packed, prev, grid_size, cursor, prev_cursor, cursor_moved):
+    """Return the (y, x) cells whose rendering changed since the last frame
+
+    Pure integer comparisons over the packed grids, kept separate from the
+    draw code so only dirty cells ever reach the screen. With no previous
+    frame (or a different grid size) every cell is dirty.
+    """
+    if prev is None or len(prev[0]) != grid_size:
+        return [(y, x) for y in range(grid_size) for x in range(grid_size)]
+
+    fences, owners, types = packed
+    prev_fences, prev_owners, prev_types = prev
+    dirty = []
+    for y in range(grid_size):
+        fence_row, owner_row, type_row = fences[y], owners[y], types[y]
+        pf_row, po_row, pt_row = prev_fences[y], prev_owners[y], prev_types[y]
+        for x in range(grid_size):
+            if (fence_row[x] != pf_row[x] or owner_row[x] != po_row[x] or
+                    type_row[x] != pt_row[x]):
+                dirty.append((y, x))
+
+    # The cells under the old and new cursor need their highlight updated
+    if cursor_moved:
+        for pos in (prev_cursor, cursor):
+            if pos is not None and pos not in dirty and pos[0] < grid_size and pos[1] < grid_size:
+                dirty.append(pos)
+
+    return dirty
@@ -1,9 +1,12 @@
 """
 Network communication module for Prospector client
 """
+import collections
+import os
 import socket
+import struct
 import threading
-from common.protocol import encode_message, decode_message
+from common.protocol import encode_message, decode_message, HEADER_SIZE
 
 class NetworkClient:
     """Handles network communication with the game server"""
@@ -16,19 +19,37 @@ class NetworkClient:
         self.connected = False
         self.callback = None
         self.receiver_thread = None
+        self.update_event = threading.Event()  # Signals the main loop that new data arrived
+        # Wake pipe: one byte is written per decoded message so the main loop
+        # can block in a selector instead of waking up periodically
+        self.wake_fd, self._wake_w = os.pipe()
+        # Reusable receive buffer; complete frames are parsed out of it in place
+        self._rxbuf = bytearray(65536)
+        self._rxlen = 0
+        # Outgoing messages are queued and coalesced into one send per batch
+        self._outq = collections.deque()
+        self._send_ready = threading.Event()
+        self.sender_thread = None
     
     def connect(self):
         """Connect to the server"""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.connect((self.host, self.port))
+            # Disable Nagle's algorithm so small interactive messages are not delayed
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self.connected = True
-            
+
             # Start receiver thread
             self.receiver_thread = threading.Thread(target=self._receive_messages)
             self.receiver_thread.daemon = True
             self.receiver_thread.start()
-            
+
+            # Start sender thread
+            self.sender_thread = threading.Thread(target=self._send_messages)
+            self.sender_thread.daemon = True
+            self.sender_thread.start()
+
             return True
         except Exception as e:
             print(f"Connection error: {e}")
@@ -37,43 +58,90 @@ class NetworkClient:
     def disconnect(self):
         """Disconnect from the server"""
         self.connected = False
+        self._send_ready.set()  # Unblock the sender thread so it can exit
         if self.socket:
             self.socket.close()
             self.socket = None
-    
+
     def send_message(self, message):
-        """Send a message to the server"""
+        """Queue a message to be sent to the server"""
         if not self.connected or not self.socket:
             return False
-        
-        try:
-            self.socket.send(encode_message(message))
-            return True
-        except Exception as e:
-            print(f"Send error: {e}")
-            self.connected = False
-            return False
+
+        self._outq.append(message)
+        self._send_ready.set()
+        return True
+
+    def _send_messages(self):
+        """Drain the outgoing queue, coalescing queued messages into one send"""
+        while self.connected and self.socket:
+            self._send_ready.wait()
+            self._send_ready.clear()
+
+            if not self._outq:
+                continue
+
+            batch = []
+            while self._outq:
+                batch.append(encode_message(self._outq.popleft()))
+
+            try:
+                self.socket.sendall(b''.join(batch))
+            except Exception as e:
+                print(f"Send error: {e}")
+                self.connected = False
+                break
     
     def set_callback(self, callback):
         """Set callback function for received messages"""
         self.callback = callback
     
     def _receive_messages(self):
-        """Continuously receive and process messages from the server"""
+        """Continuously receive and process messages from the server
+
+        TCP does not preserve message boundaries, so messages are framed with
+        a 4-byte length prefix and reassembled from a persistent buffer.
+        """
         while self.connected and self.socket:
             try:
-                data = self.socket.recv(4096)
-                if not data:
+                # Grow the buffer if a frame is larger than the space left
+                if self._rxlen == len(self._rxbuf):
+                    self._rxbuf.extend(bytes(len(self._rxbuf)))
+
+                n = self.socket.recv_into(memoryview(self._rxbuf)[self._rxlen:])
+                if n == 0:
                     break
-                
-                message = decode_message(data)
-                
-                # Call the callback if set
-                if self.callback:
-                    self.callback(message)
-                
+                self._rxlen += n
+
+                # Parse out every complete [length][payload] frame
+                offset = 0
+                while self._rxlen - offset >= HEADER_SIZE:
+                    (length,) = struct.unpack_from('>I', self._rxbuf, offset)
+                    if self._rxlen - offset - HEADER_SIZE < length:
+                        break  # Frame not fully received yet
+
+                    start = offset + HEADER_SIZE
+                    message = decode_message(memoryview(self._rxbuf)[start:start + length])
+                    offset = start + length
+
+                    # Call the callback if set
+                    if self.callback:
+                        self.callback(message)
+
+                    # Wake the main loop so it can redraw
+                    self.update_event.set()
+                    try:
+                        os.write(self._wake_w, b'\x01')
+                    except OSError:
+                        pass
+
+                # Shift any partial frame to the front of the buffer
+                if offset:
+                    self._rxbuf[:self._rxlen - offset] = self._rxbuf[offset:self._rxlen]
+                    self._rxlen -= offset
+
             except Exception as e:
                 print(f"Receive error: {e}")
                 break
-        
+
         self.connected = False
\ No newline at end of file
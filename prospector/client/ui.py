@@ -3,6 +3,9 @@ User interface module for Prospector client
 """
 import curses
 import time
+from collections import deque
+
+from client import grid_ops
 
 class GameUI:
     """Handles the curses-based user interface"""
@@ -14,7 +17,7 @@ class GameUI:
         self.width = 0
         self.student_id1 = student_id1
         self.student_id2 = student_id2
-        self.messages = []
+        self.messages = deque(maxlen=5)  # Keep only the most recent messages
         self.cursor_x = 0
         self.cursor_y = 0
         self.selected_orientation = "north"  # Default orientation
@@ -22,7 +25,35 @@ class GameUI:
         self.input_buffer = ""
         self.input_prompt = ""
         self.input_callback = None
-    
+        self._input_prompt_drawn = False
+        # Snapshot of the last drawn frame, used to skip unchanged grid cells
+        self._prev_grid = None
+        self._prev_cursor = None
+        self._prev_orientation = None
+        # Packed copy of the grid, rebuilt once per game_state update so the
+        # draw loop reads small ints instead of repeated dict lookups
+        self._packed_grid = None
+        self._packed_for = None
+        # Off-screen pad the grid is rendered into; blitted in refresh()
+        self._grid_pad = None
+        self._grid_pad_size = None
+        self._grid_pad_view = None
+        # Cached curses attribute values, filled in by initialize()
+        self.attrs = [0] * 7
+        self.ATTR_HIGHLIGHT = 0
+        # Blank line cache, rebuilt on resize instead of per frame
+        self._blank_line = ""
+        # Dispatch table for special keys in text input mode (backspace has
+        # several possible key codes depending on the terminal)
+        self._input_dispatch = {
+            10: self._finish_input,             # Enter
+            27: self._cancel_input,             # Escape
+            curses.KEY_RESIZE: self._handle_resize,
+            curses.KEY_BACKSPACE: self._backspace,
+            127: self._backspace,
+            8: self._backspace,
+        }
+
     def initialize(self):
         """Initialize curses and set up the screen"""
         # Initialize curses
@@ -35,6 +66,7 @@ class GameUI:
         
         # Get screen dimensions
         self.height, self.width = self.screen.getmaxyx()
+        self._blank_line = " " * self.width
         
         # Initialize color pairs
         curses.init_pair(1, curses.COLOR_WHITE, curses.COLOR_BLACK)  # Default
@@ -43,7 +75,11 @@ class GameUI:
         curses.init_pair(4, curses.COLOR_CYAN, curses.COLOR_BLACK)   # Player 1
         curses.init_pair(5, curses.COLOR_YELLOW, curses.COLOR_BLACK) # Player 2
         curses.init_pair(6, curses.COLOR_BLUE, curses.COLOR_BLACK)   # Highlight
-        
+
+        # Cache attribute values once so draw paths don't rebuild them per call
+        self.attrs = [0] + [curses.color_pair(i) for i in range(1, 7)]
+        self.ATTR_HIGHLIGHT = self.attrs[6] | curses.A_BOLD
+
         return True
     
     def cleanup(self):
@@ -58,16 +94,54 @@ class GameUI:
     def clear(self):
         """Clear the screen"""
         self.screen.clear()
+        self._prev_grid = None
+        self._grid_pad_view = None  # Nothing to blit until the grid is drawn again
+
+    def mark_dirty(self):
+        """Force a full grid redraw on the next frame"""
+        self._prev_grid = None
+
+    def grid_updated(self):
+        """Repack the grid on the next frame after an in-place mutation"""
+        self._packed_for = None
+
+    def apply_cell_updates(self, cell_updates, owner_index):
+        """Apply delta cell updates straight to the packed grid
+
+        Returns False when there is no packed grid yet, in which case the
+        caller should fall back to a full repack via grid_updated().
+        """
+        if self._packed_grid is None:
+            return False
+        self._packed_grid = grid_ops.apply_cell_updates(self._packed_grid,
+                                                        cell_updates, owner_index)
+        return True
     
     def refresh(self):
-        """Refresh the screen"""
-        self.screen.refresh()
+        """Refresh the screen, overlaying the grid pad in the same update"""
+        self.screen.noutrefresh()
+        if self._grid_pad is not None and self._grid_pad_view is not None:
+            top_y, left_x, bottom_y, right_x = self._grid_pad_view
+            try:
+                self._grid_pad.noutrefresh(0, 0, top_y, left_x, bottom_y, right_x)
+            except curses.error:
+                pass
+        curses.doupdate()
+
+    def _handle_resize(self):
+        """Re-read the terminal size and invalidate size-derived caches"""
+        self.height, self.width = self.screen.getmaxyx()
+        self._blank_line = " " * self.width
+        self._input_prompt_drawn = False
+        self.clear()  # Everything must be repainted at the new size
+
+    def set_input_timeout(self, timeout_ms):
+        """Set how long getch() blocks waiting for a key (-1 to block forever)"""
+        self.screen.timeout(timeout_ms)
     
     def add_message(self, message, color=1):
         """Add a message to the message queue"""
         self.messages.append((message, color))
-        if len(self.messages) > 5:  # Keep only the most recent messages
-            self.messages.pop(0)
     
     def display_header(self):
         """Display the game header"""
@@ -89,7 +163,10 @@ class GameUI:
         
         for i, (msg, color) in enumerate(self.messages):
             try:
-                self.screen.addstr(message_y + i, 1, msg, curses.color_pair(color))
+                # Pad to the screen width so shorter messages fully overwrite
+                # whatever was drawn on this line before
+                self.screen.addstr(message_y + i, 1, msg.ljust(self.width - 2)[:self.width - 2],
+                                   self.attrs[color])
             except curses.error:
                 # Handle edge case if message is too long or position is out of bounds
                 pass
@@ -105,7 +182,7 @@ class GameUI:
         for i, option in enumerate(options):
             try:
                 if i == current_option:
-                    self.screen.addstr(menu_y + i + 2, 4, f"> {option}", curses.color_pair(6) | curses.A_BOLD)
+                    self.screen.addstr(menu_y + i + 2, 4, f"> {option}", self.ATTR_HIGHLIGHT)
                 else:
                     self.screen.addstr(menu_y + i + 2, 4, f"  {option}")
             except curses.error:
@@ -125,15 +202,11 @@ class GameUI:
         if not game_state:
             return
         
-        # Game info
-        game_info_y = 5
-        try:
-            self.screen.addstr(game_info_y, 2, f"Game ID: {game_state['game_id']}")
-        except curses.error:
-            pass
-        
-        # Player information
-        player_info_y = game_info_y + 2
+        # Game info with highlighted ID
+        self.highlight_game_id(game_state['game_id'])
+
+        # Player information (below the highlighted game ID box)
+        player_info_y = 10
         try:
             self.screen.addstr(player_info_y, 2, "Players:")
         except curses.error:
@@ -144,7 +217,7 @@ class GameUI:
             try:
                 self.screen.addstr(player_info_y + i + 1, 4, 
                                   f"{player['name']} - Score: {player['score']}", 
-                                  curses.color_pair(color))
+                                  self.attrs[color])
             except curses.error:
                 pass
         
@@ -152,24 +225,25 @@ class GameUI:
         current_player = game_state['players'][game_state['current_player_index']]
         current_player_y = player_info_y + len(game_state['players']) + 2
         try:
-            self.screen.addstr(current_player_y, 2, f"Current turn: {current_player['name']}")
+            # Padded so a longer previous name is fully overwritten
+            self.screen.addstr(current_player_y, 2, f"Current turn: {current_player['name']}".ljust(40))
         except curses.error:
             pass
         
         # Draw the game grid
         grid_y = current_player_y + 2
         grid_x = 10
-        self._draw_grid(grid_y, grid_x, game_state['grid'], game_state['grid_size'])
+        self._draw_grid(grid_y, grid_x, game_state)
         
         # Game status
         status_y = grid_y + game_state['grid_size'] * 2 + 2
         if game_state['game_over']:
             try:
                 if game_state['winner'] == 'draw':
-                    self.screen.addstr(status_y, 2, "Game Over - It's a draw!", curses.color_pair(6))
+                    self.screen.addstr(status_y, 2, "Game Over - It's a draw!", self.attrs[6])
                 else:
                     winner = next((p['name'] for p in game_state['players'] if p['id'] == game_state['winner']), "Unknown")
-                    self.screen.addstr(status_y, 2, f"Game Over - Winner: {winner}", curses.color_pair(2))
+                    self.screen.addstr(status_y, 2, f"Game Over - Winner: {winner}", self.attrs[2])
             except curses.error:
                 pass
         
@@ -177,105 +251,148 @@ class GameUI:
         controls_y = status_y + 2
         try:
             self.screen.addstr(controls_y, 2, "Controls: Arrow keys to move, Space to change orientation, Enter to place fence")
-            self.screen.addstr(controls_y + 1, 2, f"Selected orientation: {self.selected_orientation}")
+            # Padded so "north"/"south" leftovers don't trail "east"/"west"
+            self.screen.addstr(controls_y + 1, 2, f"Selected orientation: {self.selected_orientation}".ljust(40))
         except curses.error:
             pass
     
-    def _draw_grid(self, start_y, start_x, grid, grid_size):
-        """Draw the game grid"""
+    # Pre-rendered glyphs indexed by fence bit (0 = absent, 1 = present) and
+    # by owner index, so drawing is a table lookup instead of a branch
+    _NS_GLYPH = ('   ', '---')
+    _WE_GLYPH = (' ', '|')
+    _OWNER_GLYPH = ('A', 'B', 'C', 'D')
+    _OWNER_COLOR = (4, 5, 5, 5)  # Color pair per owner index
+
+    def _draw_grid(self, start_y, start_x, game_state):
+        """Draw the game grid one row-string at a time, only for changed rows"""
         cell_width = 4  # Width of each cell in characters
-        
+        grid = game_state['grid']
+        grid_size = game_state['grid_size']
+
         # Safety check to ensure grid has the right dimensions
         if not grid or len(grid) != grid_size:
             return
-        
-        for y in range(grid_size):
-            if y >= len(grid):
-                continue
-                
+
+        # (Re)create the off-screen pad when the grid size changes
+        if self._grid_pad is None or self._grid_pad_size != grid_size:
+            self._grid_pad = curses.newpad(2 * grid_size + 2, 4 * grid_size + 3)
+            self._grid_pad_size = grid_size
+            self._prev_grid = None  # The new pad starts blank
+
+        # Where the pad lands on the screen, clipped to the window
+        self._grid_pad_view = (start_y, start_x - 1,
+                               min(start_y + 2 * grid_size, self.height - 1),
+                               min(start_x + 4 * grid_size + 1, self.width - 1))
+
+        # Repack only when a new game_state (and therefore grid) arrived
+        if grid is not self._packed_for:
+            self._packed_grid = grid_ops.pack_grid(grid, game_state['players'])
+            self._packed_for = grid
+        fences, owners, types = self._packed_grid
+
+        # Work out exactly which cells need redrawing
+        cursor = (self.cursor_y, self.cursor_x)
+        cursor_moved = (cursor != self._prev_cursor or
+                        self.selected_orientation != self._prev_orientation)
+        dirty = grid_ops.diff_grids(self._packed_grid, self._prev_grid, grid_size,
+                                    cursor, self._prev_cursor, cursor_moved)
+
+        # Redraw whole rows: one addstr for the north-fence line and one for
+        # the content line, instead of five addstr calls per cell. A cursor
+        # highlight may sit on the next row's fence line, so include it too.
+        rows = {y for y, x in dirty}
+        if cursor_moved:
+            for pos in (self._prev_cursor, cursor):
+                if pos is not None and pos[0] + 1 < grid_size:
+                    rows.add(pos[0] + 1)
+
+        for y in sorted(rows):
+            fence_row = fences[y]
+            owner_row = owners[y]
+            cell_y = y * 2  # Pad-relative coordinates
+
+            # Top line: north fences, one glyph per cell
+            top_line = ' '.join(self._NS_GLYPH[fence_row[x] & 1]
+                                for x in range(grid_size))
+
+            # Middle line: west fences and cell contents, plus the final east fence
+            parts = []
             for x in range(grid_size):
-                if x >= len(grid[y]):
-                    continue
-                    
-                cell = grid[y][x]
-                cell_y = start_y + y * 2
-                cell_x = start_x + x * cell_width
-                
-                # Check if we're within screen bounds
-                if cell_y >= self.height - 1 or cell_x >= self.width - 3:
-                    continue
-                
-                # Draw north fence (or space)
-                north_char = '---' if cell.get('north', False) else '   '
-                try:
-                    if self.cursor_y == y and self.cursor_x == x and self.selected_orientation == 'north':
-                        self.screen.addstr(cell_y, cell_x, north_char, curses.color_pair(6) | curses.A_BOLD)
-                    else:
-                        self.screen.addstr(cell_y, cell_x, north_char)
-                except curses.error:
-                    pass
-                
-                # Draw west fence (or space)
-                west_char = '|' if cell.get('west', False) else ' '
-                try:
-                    if self.cursor_y == y and self.cursor_x == x and self.selected_orientation == 'west':
-                        self.screen.addstr(cell_y + 1, cell_x - 1, west_char, curses.color_pair(6) | curses.A_BOLD)
-                    else:
-                        self.screen.addstr(cell_y + 1, cell_x - 1, west_char)
-                except curses.error:
-                    pass
-                
-                # Draw cell content (owner indicator)
-                cell_content = ' '
-                cell_color = 1  # Default color
-                
-                if cell.get('owner') is not None:
-                    # Find owner in players list to determine color
-                    player_index = 0
-                    for i, player in enumerate(grid):
-                        if isinstance(player, dict) and player.get('id') == cell.get('owner'):
-                            player_index = i
-                            break
-                    
-                    cell_color = 4 if player_index == 0 else 5
-                    cell_content = 'A' if player_index == 0 else 'B'
-                
-                try:
-                    self.screen.addstr(cell_y + 1, cell_x + 1, cell_content, curses.color_pair(cell_color))
-                except curses.error:
-                    pass
-                
-                # Draw east fence (or space)
-                east_char = '|' if cell.get('east', False) else ' '
-                try:
-                    if self.cursor_y == y and self.cursor_x == x and self.selected_orientation == 'east':
-                        self.screen.addstr(cell_y + 1, cell_x + 3, east_char, curses.color_pair(6) | curses.A_BOLD)
-                    else:
-                        self.screen.addstr(cell_y + 1, cell_x + 3, east_char)
-                except curses.error:
-                    pass
-                
-                # Draw south fence (or space)
-                south_char = '---' if cell.get('south', False) else '   '
-                try:
-                    if self.cursor_y == y and self.cursor_x == x and self.selected_orientation == 'south':
-                        self.screen.addstr(cell_y + 2, cell_x, south_char, curses.color_pair(6) | curses.A_BOLD)
-                    else:
-                        self.screen.addstr(cell_y + 2, cell_x, south_char)
-                except curses.error:
-                    pass
-    
+                owner = owner_row[x]
+                content = self._OWNER_GLYPH[owner] if owner >= 0 else ' '
+                parts.append(self._WE_GLYPH[(fence_row[x] >> 3) & 1] + ' ' + content + ' ')
+            parts.append(self._WE_GLYPH[(fence_row[grid_size - 1] >> 1) & 1])
+            mid_line = ''.join(parts)
+
+            try:
+                self._grid_pad.addstr(cell_y, 1, top_line)
+                self._grid_pad.addstr(cell_y + 1, 0, mid_line)
+            except curses.error:
+                pass
+
+            # Overlay owner glyphs in their player colors
+            for x in range(grid_size):
+                owner = owner_row[x]
+                if owner >= 0:
+                    try:
+                        self._grid_pad.addstr(cell_y + 1, x * cell_width + 2,
+                                              self._OWNER_GLYPH[owner],
+                                              self.attrs[self._OWNER_COLOR[owner]])
+                    except curses.error:
+                        pass
+
+        # Bottom line: south fences of the last row
+        if grid_size - 1 in rows:
+            bottom_line = ' '.join(self._NS_GLYPH[(fences[grid_size - 1][x] >> 2) & 1]
+                                   for x in range(grid_size))
+            try:
+                self._grid_pad.addstr(grid_size * 2, 1, bottom_line)
+            except curses.error:
+                pass
+
+        # Overlay the highlighted fence at the cursor
+        cy, cx = cursor
+        if cy < grid_size and cx < grid_size:
+            fence_mask = fences[cy][cx]
+            cell_y = cy * 2
+            cell_x = 1 + cx * cell_width
+            try:
+                if self.selected_orientation == 'north':
+                    self._grid_pad.addstr(cell_y, cell_x, self._NS_GLYPH[fence_mask & 1], self.ATTR_HIGHLIGHT)
+                elif self.selected_orientation == 'south':
+                    self._grid_pad.addstr(cell_y + 2, cell_x, self._NS_GLYPH[(fence_mask >> 2) & 1], self.ATTR_HIGHLIGHT)
+                elif self.selected_orientation == 'west':
+                    self._grid_pad.addstr(cell_y + 1, cell_x - 1, self._WE_GLYPH[(fence_mask >> 3) & 1], self.ATTR_HIGHLIGHT)
+                else:  # east
+                    self._grid_pad.addstr(cell_y + 1, cell_x + 3, self._WE_GLYPH[(fence_mask >> 1) & 1], self.ATTR_HIGHLIGHT)
+            except curses.error:
+                pass
+
+        # The packed grids are never mutated, so keeping a reference is enough
+        # for the next frame's diff
+        self._prev_grid = self._packed_grid
+        self._prev_cursor = cursor
+        self._prev_orientation = self.selected_orientation
+
     def handle_input(self, game_state=None):
         """Handle keyboard input"""
         if self.input_mode:
             return self._handle_input_mode()
         
         key = self.screen.getch()
-        
+
+        # No key pressed before the input timeout expired
+        if key == -1:
+            return None
+
+        if key == curses.KEY_RESIZE:
+            self._handle_resize()
+            return key  # The caller redraws at the new size
+
         # If in a game
         if game_state:
             grid_size = game_state.get('grid_size', 5)
-            
+
             if key == curses.KEY_UP:
                 self.cursor_y = max(0, self.cursor_y - 1)
             elif key == curses.KEY_DOWN:
@@ -298,12 +415,13 @@ class GameUI:
                 }
             elif key == ord('q'):
                 return {'action': 'quit'}
-        
+
+            # Return the key so the caller knows the UI state changed
+            return key
+
         # If in menu
         else:
             return key
-        
-        return None
     
     def prompt_input(self, prompt, callback):
         """Show a prompt for user input"""
@@ -311,46 +429,79 @@ class GameUI:
         self.input_prompt = prompt
         self.input_buffer = ""
         self.input_callback = callback
+        self._input_prompt_drawn = False
         curses.curs_set(1)  # Show cursor
     
     def _handle_input_mode(self):
         """Handle input in text input mode"""
+        # Draw the full prompt once; afterwards only echo single characters
+        if not self._input_prompt_drawn:
+            try:
+                self.screen.addstr(self.height - 3, 1, (self.input_prompt + self._blank_line)[:self.width - 2])
+                self.screen.addstr(self.height - 2, 1, self._blank_line[:self.width - 2])
+                self.screen.move(self.height - 2, 1)
+            except curses.error:
+                # Handle edge case if screen size is too small
+                pass
+            self._input_prompt_drawn = True
+
         key = self.screen.getch()
-        
-        if key == 10:  # Enter key
-            result = self.input_buffer
-            self.input_mode = False
-            self.input_buffer = ""
-            curses.curs_set(0)  # Hide cursor
-            
-            if self.input_callback:
-                self.input_callback(result)
-                self.input_callback = None
-        elif key == 27:  # Escape key
-            self.input_mode = False
-            self.input_buffer = ""
-            curses.curs_set(0)  # Hide cursor
-            
-            if self.input_callback:
-                self.input_callback(None)
-                self.input_callback = None
-        elif key == curses.KEY_BACKSPACE or key == 127 or key == 8:
-            # Handle backspace (multiple possible key codes)
-            self.input_buffer = self.input_buffer[:-1]
+
+        if key == -1:  # No key pressed before the input timeout expired
+            return None
+
+        # Special keys dispatch through the table; anything printable is echoed
+        handler = self._input_dispatch.get(key)
+        if handler:
+            handler()
         elif 32 <= key <= 126:  # Printable characters
+            try:
+                # Echo just the typed character at the cursor position
+                self.screen.addch(self.height - 2, 1 + len(self.input_buffer), key)
+            except curses.error:
+                pass
             self.input_buffer += chr(key)
-        
-        # Display the prompt and input
-        try:
-            self.screen.addstr(self.height - 3, 1, self.input_prompt + " " * (self.width - len(self.input_prompt) - 2))
-            self.screen.addstr(self.height - 2, 1, self.input_buffer + " " * (self.width - len(self.input_buffer) - 2))
-            self.screen.move(self.height - 2, 1 + len(self.input_buffer))  # Move cursor to end of input
-        except curses.error:
-            # Handle edge case if screen size is too small
-            pass
-        
+
+        # Push the echo to the terminal now; the main loop only refreshes on
+        # its own events, which can be up to its safety timeout away
+        self.screen.refresh()
+
         return None
 
+    def _finish_input(self):
+        """Commit the input buffer and hand it to the callback (Enter)"""
+        result = self.input_buffer
+        self.input_mode = False
+        self.input_buffer = ""
+        curses.curs_set(0)  # Hide cursor
+
+        if self.input_callback:
+            callback = self.input_callback
+            self.input_callback = None
+            callback(result)
+
+    def _cancel_input(self):
+        """Abort input mode and tell the callback nothing was entered (Escape)"""
+        self.input_mode = False
+        self.input_buffer = ""
+        curses.curs_set(0)  # Hide cursor
+
+        if self.input_callback:
+            callback = self.input_callback
+            self.input_callback = None
+            callback(None)
+
+    def _backspace(self):
+        """Delete the last buffered character and erase its echo"""
+        if self.input_buffer:
+            self.input_buffer = self.input_buffer[:-1]
+            try:
+                # Blank out the erased character and step the cursor back
+                self.screen.addch(self.height - 2, 1 + len(self.input_buffer), ' ')
+                self.screen.move(self.height - 2, 1 + len(self.input_buffer))
+            except curses.error:
+                pass
+
     def highlight_game_id(self, game_id):
         """Display game ID prominently"""
         try:
@@ -368,62 +519,11 @@ class GameUI:
             self.screen.addstr(box_y + 1, box_x + len(game_id_text) + 3, "|", curses.A_BOLD)
             
             # Draw the game ID in bright color
-            self.screen.addstr(box_y + 1, box_x + 2, game_id_text, curses.color_pair(2) | curses.A_BOLD)
+            self.screen.addstr(box_y + 1, box_x + 2, game_id_text, self.attrs[2] | curses.A_BOLD)
             
             # Add instruction
-            self.screen.addstr(box_y + 3, box_x, "Copy this ID to join from another client", curses.color_pair(6))
+            self.screen.addstr(box_y + 3, box_x, "Copy this ID to join from another client", self.attrs[6])
             
         except curses.error:
             # Handle edge case if screen size is too small
             self.add_message(f"GAME ID: {game_id} (copy this to join)", 2)
-
-    # Update the display_game method to call highlight_game_id
-    def display_game(self, game_state):
-        """Display the current game state"""
-        if not game_state:
-            return
-        
-        # Game info with highlighted ID
-        self.highlight_game_id(game_state['game_id'])
-        
-        # Rest of method remains the same...
-        # Player information
-        player_info_y = 10  # Adjusted to make room for highlighted game ID
-        try:
-            self.screen.addstr(player_info_y, 2, "Players:")
-        except curses.error:
-            pass
-        
-    def handle_server_message(self, message):
-        """Handle a message from the server with improved UI integration"""
-        status = message.get('status')
-        
-        if status == 'error':
-            print(f"Error: {message.get('message')}")
-            self.add_message(f"Error: {message.get('message')}", 3)
-        elif status == 'success':
-            if 'game_state' in message:
-                self.game_state = message['game_state']
-                self.game_id = message['game_state']['game_id']
-                
-                # Add game ID to console for backup
-                print(f"\n=== GAME ID: {self.game_id} ===\n")
-                
-                # Make sure game ID is visible in messages too
-                self.add_message(f"GAME ID: {self.game_id} (copy this)", 2)
-                self.add_message(message.get('message', 'Game updated'), 2)
-            elif 'username' in message:
-                self.logged_in = True
-                self.username = message['username']
-                self.add_message(f"Successfully logged in as {self.username}", 2)
-            elif 'stats' in message:
-                stats = message['stats']
-                self.add_message(f"Player: {stats['name']}", 2)
-                self.add_message(f"Wins: {stats['wins']}, Losses: {stats['losses']}, Draws: {stats['draws']}", 2)
-            elif 'recordings' in message:
-                self.recordings = message['recordings']
-                self.display_recordings()
-            elif 'recording' in message:
-                self.start_replay(message['recording'])
-            else:
-                self.add_message(message.get('message', 'Success'), 2)
\ No newline at end of file
@@ -2,6 +2,19 @@
 Common protocol definitions for Prospector game
 """
 import json
+import struct
+import sys
+
+try:
+    # orjson encodes straight to bytes and is several times faster than the
+    # stdlib encoder on the per-turn game_state payloads
+    import orjson
+except ImportError:
+    orjson = None
+
+# Each message on the wire is a 4-byte big-endian length followed by the
+# JSON payload, since TCP does not preserve message boundaries
+HEADER_SIZE = 4
 
 # Message types (actions)
 CREATE_GAME = "create_game"
@@ -9,6 +22,7 @@ JOIN_GAME = "join_game"
 PLACE_FENCE = "place_fence"
 LEAVE_GAME = "leave_game"
 GET_STATS = "get_stats"
+GET_GAME_STATE = "get_game_state"
 
 # Response statuses
 SUCCESS = "success"
@@ -22,12 +36,32 @@ def create_message(action, **kwargs):
     return message
 
 def encode_message(message):
-    """Encode a message to JSON string"""
-    return json.dumps(message).encode('utf-8')
+    """Encode a message to a length-prefixed JSON frame"""
+    if orjson is not None:
+        payload = orjson.dumps(message)
+    else:
+        payload = json.dumps(message).encode('utf-8')
+    return struct.pack('>I', len(payload)) + payload
 
 def decode_message(data):
-    """Decode a JSON string to a message dictionary"""
-    return json.loads(data.decode('utf-8'))
+    """Decode a JSON payload (without the length prefix) to a message dictionary
+
+    The action and orientation fields are interned: the parser returns fresh
+    string objects, and interning lets the dispatch and fence-placement
+    paths compare them by identity against the module-level constants.
+    """
+    if orjson is not None:
+        message = orjson.loads(data)
+    else:
+        message = json.loads(bytes(data).decode('utf-8'))
+    if isinstance(message, dict):
+        action = message.get('action')
+        if type(action) is str:
+            message['action'] = sys.intern(action)
+        orientation = message.get('orientation')
+        if type(orientation) is str:
+            message['orientation'] = sys.intern(orientation)
+    return message
 
 # Client to Server message creation helpers
 def create_game_message(player_name, grid_size=5, num_players=2):
@@ -63,6 +97,13 @@ def leave_game_message(game_id):
         game_id=game_id
     )
 
+def get_game_state_message(game_id):
+    """Create a message requesting a full game-state snapshot (delta resync)"""
+    return create_message(
+        GET_GAME_STATE,
+        game_id=game_id
+    )
+
 def get_stats_message(player_id=None):
     """Create a message to get player statistics"""
     return create_message(
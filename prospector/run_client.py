@@ -3,24 +3,108 @@
 Client implementation for Prospector game
 """
 import sys
+import os
+import select
+import selectors
 import curses
 import socket
+import struct
 import json
+import queue
 import threading
 import time
+import logging
+from collections import deque
+
+try:
+    # orjson encodes straight to bytes and is several times faster than the
+    # stdlib codec on game_state and recording payloads
+    import orjson
+except ImportError:
+    orjson = None
+
+# Diagnostics go to a file: curses owns the terminal, so printing to
+# stdout corrupts the display, and formatting a full game_state per packet
+# is wasted work. Debug records are skipped entirely at INFO level.
+logging.basicConfig(filename='client.log', level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Each message on the wire is a 4-byte big-endian length followed by the JSON
+# payload, since TCP does not preserve message boundaries
+HEADER_SIZE = 4
+
+# Fence bit positions in the packed per-cell mask
+FENCE_NORTH = 1
+FENCE_EAST = 2
+FENCE_SOUTH = 4
+FENCE_WEST = 8
+
+FENCE_BITS = {
+    "north": FENCE_NORTH,
+    "east": FENCE_EAST,
+    "south": FENCE_SOUTH,
+    "west": FENCE_WEST
+}
+
+# Land types mapped to small indices, with per-index display char and color
+TYPE_INDEX = {"regular": 0, "copper": 1, "gold": 2}
+TYPE_CHARS = (" ", "C", "G")
+TYPE_COLORS = (1, 8, 7)
+
+def pack_grid(grid, owner_index):
+    """Pack a dict grid into parallel int grids (fences, owners, types)
+
+    Each fence mask packs north/east/south/west into one int, the owner is
+    the player's index in the players list (-1 when unowned) and the type is
+    a small index. Built once per game_state update so the renderer does bit
+    tests and list indexing instead of six dict lookups per cell per frame.
+    """
+    fences = []
+    owners = []
+    types = []
+    for row in grid:
+        fence_row = []
+        owner_row = []
+        type_row = []
+        for cell in row:
+            mask = 0
+            if cell.get('north'):
+                mask |= FENCE_NORTH
+            if cell.get('east'):
+                mask |= FENCE_EAST
+            if cell.get('south'):
+                mask |= FENCE_SOUTH
+            if cell.get('west'):
+                mask |= FENCE_WEST
+            fence_row.append(mask)
+            owner_row.append(owner_index.get(cell.get('owner'), -1))
+            type_row.append(TYPE_INDEX.get(cell.get('type'), 0))
+        fences.append(fence_row)
+        owners.append(owner_row)
+        types.append(type_row)
+    return fences, owners, types
 
 # Protocol functions
 def encode_message(message):
-    """Encode a message to JSON string"""
-    return json.dumps(message).encode('utf-8')
+    """Encode a message to a length-prefixed JSON frame"""
+    if orjson is not None:
+        payload = orjson.dumps(message)
+    else:
+        payload = json.dumps(message).encode('utf-8')
+    return struct.pack('>I', len(payload)) + payload
 
 def decode_message(data):
-    """Decode a JSON string to a message dictionary"""
-    return json.loads(data.decode('utf-8'))
+    """Decode a JSON payload (without the length prefix) to a message dictionary"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data).decode('utf-8'))
 
 class ProspectorClient:
     """Client for Prospector game"""
     
+    # Orientation cycle for the spacebar picker
+    _ORIENTS = ('north', 'east', 'south', 'west')
+    
     def __init__(self, student_id1, student_id2, host='127.0.0.1', port=5555):
         """Initialize the client"""
         # Student IDs
@@ -37,6 +121,23 @@ class ProspectorClient:
         self.game_id = None
         self.game_state = None
         self.running = False
+
+        # Decoded server messages, queued by the receiver thread and drained
+        # on the UI thread so game state is only ever touched from one thread
+        self.inbox = queue.Queue()
+
+        # Wake pipe: the receiver writes a byte per queued message so the
+        # main loop can block in select() instead of sleeping between frames
+        self.wake_r, self.wake_w = os.pipe()
+
+        # Shutdown pipe: disconnect() writes a byte so the receiver thread
+        # exits cleanly instead of erroring on a closed socket
+        self._shutdown_r, self._shutdown_w = os.pipe()
+
+        # Reusable receive buffer; complete frames are parsed out of it in
+        # place so steady-state receiving allocates almost nothing
+        self._rxbuf = bytearray(1 << 16)
+        self._rxlen = 0
         
         # Authentication
         self.logged_in = False
@@ -46,10 +147,13 @@ class ProspectorClient:
         self.screen = None
         self.height = 0
         self.width = 0
-        self.messages = []
+        self.dirty = True  # Whether the screen needs to be redrawn
+        self._last_view = None  # Which view the previous frame drew
+        self._drawn_timer = None  # Countdown seconds shown by the last frame
+        self.messages = deque(maxlen=5)  # Oldest message drops off automatically
         self.cursor_x = 0
         self.cursor_y = 0
-        self.selected_orientation = "north"
+        self._orient_idx = 0  # Index into _ORIENTS
         self.menu_position = 0
         self.menu_options = [
             "Create a new game", 
@@ -65,7 +169,28 @@ class ProspectorClient:
         self.input_buffer = ""
         self.input_prompt = ""
         self.input_callback = None
+        self._last_input_len = -1  # -1 marks a freshly opened prompt
         
+        # Grid packed into parallel int grids, rebuilt per game_state update
+        self._packed_grid = None
+
+        # Bumped per game_state update so per-state render strings (player
+        # score lines) are only reformatted when the state actually changed
+        self._gs_version = 0
+        self._player_lines = []
+        self._player_lines_version = -1
+
+        # Success messages carry one of these fields; the first match picks
+        # the handler
+        self._success_handlers = {
+            'game_state': self._on_game_state,
+            'delta': self._on_delta,
+            'username': self._on_username,
+            'stats': self._on_stats,
+            'recordings': self._on_recordings,
+            'recording': self._on_recording
+        }
+
         # Replay mode variables
         self.replay_mode = False
         self.replay_state = None
@@ -74,12 +199,20 @@ class ProspectorClient:
         self.recordings = []
         self.recording_position = 0
     
+    @property
+    def selected_orientation(self):
+        """The fence orientation the spacebar picker currently selects"""
+        return self._ORIENTS[self._orient_idx]
+    
     def connect(self):
         """Connect to the server"""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.connect((self.host, self.port))
-            print(f"Connected to server at {self.host}:{self.port}")
+            # Disable Nagle's algorithm so small actions (cursor moves, fence
+            # placements) go out immediately instead of waiting to coalesce
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            logger.info("connected to server at %s:%s", self.host, self.port)
             
             # Start receiver thread
             self.receiver_thread = threading.Thread(target=self.receive_messages)
@@ -88,11 +221,12 @@ class ProspectorClient:
             
             return True
         except Exception as e:
-            print(f"Connection error: {e}")
+            logger.error("connection error: %s", e)
             return False
     
     def disconnect(self):
         """Disconnect from the server"""
+        os.write(self._shutdown_w, b'\x01')  # Stop the receiver thread
         if self.socket:
             self.socket.close()
             self.socket = None
@@ -100,62 +234,170 @@ class ProspectorClient:
     def send_message(self, message):
         """Send a message to the server"""
         if not self.socket:
-            print("Not connected to server")
+            logger.warning("not connected to server")
             return False
         
         try:
-            print(f"Sending: {message}")
-            self.socket.send(encode_message(message))
+            # sendall retries short writes; send() may silently truncate
+            self.socket.sendall(encode_message(message))
             return True
         except Exception as e:
-            print(f"Send error: {e}")
+            logger.error("send error: %s", e)
             return False
     
     def receive_messages(self):
-        """Receive messages from the server"""
-        while self.running and self.socket:
-            try:
-                data = self.socket.recv(4096)
-                if not data:
-                    print("Disconnected from server")
-                    self.add_message("Disconnected from server", 3)
-                    break
-                
-                message = decode_message(data)
-                print(f"Received: {message}")
-                self.handle_server_message(message)
-                
-            except Exception as e:
-                print(f"Receive error: {e}")
-                break
+        """Receive messages from the server
+
+        Messages are framed with a 4-byte length prefix. A selector watches
+        the socket and a shutdown pipe, so disconnect() stops this thread
+        deterministically instead of relying on the exception from closing
+        the socket underneath it. Each recv pulls up to 64 KiB into a
+        persistent buffer and every complete frame in it is decoded before
+        the next syscall.
+        """
+        sel = selectors.DefaultSelector()
+        sel.register(self.socket, selectors.EVENT_READ)
+        sel.register(self._shutdown_r, selectors.EVENT_READ)
+        try:
+            while self.running and self.socket:
+                for key, _ in sel.select(timeout=1.0):
+                    if key.fd == self._shutdown_r:
+                        os.read(self._shutdown_r, 4096)
+                        return
+
+                    try:
+                        # Grow the buffer if a frame exceeds the space left
+                        if self._rxlen == len(self._rxbuf):
+                            self._rxbuf.extend(bytes(len(self._rxbuf)))
+
+                        n = self.socket.recv_into(memoryview(self._rxbuf)[self._rxlen:])
+                    except Exception as e:
+                        logger.error("receive error: %s", e)
+                        return
+                    if n == 0:
+                        self.add_message("Disconnected from server", 3)
+                        return
+                    self._rxlen += n
+
+                    # Parse out every complete [length][payload] frame
+                    offset = 0
+                    while self._rxlen - offset >= HEADER_SIZE:
+                        (length,) = struct.unpack_from('>I', self._rxbuf, offset)
+                        if self._rxlen - offset - HEADER_SIZE < length:
+                            break  # Frame not fully received yet
+
+                        start = offset + HEADER_SIZE
+                        message = decode_message(memoryview(self._rxbuf)[start:start + length])
+                        offset = start + length
+
+                        logger.debug("recv %r", message)
+                        self.inbox.put(message)
+                        os.write(self.wake_w, b'\x01')
+
+                    # Shift any partial frame to the front of the buffer
+                    if offset:
+                        self._rxbuf[:self._rxlen - offset] = self._rxbuf[offset:self._rxlen]
+                        self._rxlen -= offset
+        finally:
+            sel.close()
     
     def handle_server_message(self, message):
-        """Handle a message from the server"""
+        """Handle a message from the server
+
+        Success messages are dispatched through a field -> handler table
+        rather than a chain of `in` probes.
+        """
         status = message.get('status')
-        
+
         if status == 'error':
-            print(f"Error: {message.get('message')}")
             self.add_message(f"Error: {message.get('message')}", 3)
         elif status == 'success':
-            if 'game_state' in message:
-                self.game_state = message['game_state']
-                self.game_id = message['game_state']['game_id']
-                self.add_message(message.get('message', 'Game updated'), 2)
-            elif 'username' in message:
-                self.logged_in = True
-                self.username = message['username']
-                self.add_message(f"Successfully logged in as {self.username}", 2)
-            elif 'stats' in message:
-                stats = message['stats']
-                self.add_message(f"Player: {stats['name']}", 2)
-                self.add_message(f"Wins: {stats['wins']}, Losses: {stats['losses']}, Draws: {stats['draws']}", 2)
-            elif 'recordings' in message:
-                self.recordings = message['recordings']
-                self.display_recordings()
-            elif 'recording' in message:
-                self.start_replay(message['recording'])
-            else:
-                self.add_message(message.get('message', 'Success'), 2)
+            for field, handler in self._success_handlers.items():
+                if field in message:
+                    handler(message)
+                    return
+            self.add_message(message.get('message', 'Success'), 2)
+
+    def _on_game_state(self, message):
+        """Install a new game_state snapshot and its packed grid"""
+        self.game_state = message['game_state']
+        self.game_id = self.game_state['game_id']
+        self._gs_version += 1
+        owner_index = {p['id']: i for i, p in enumerate(self.game_state['players'])}
+        self._packed_grid = pack_grid(self.game_state['grid'], owner_index)
+        self.add_message(message.get('message', 'Game updated'), 2)
+
+    def _on_delta(self, message):
+        """Apply an incremental update sent in place of a full snapshot
+
+        A move changes at most two cells, so the server sends just those
+        plus score and turn updates. Deltas carry a version number; on a
+        gap the client asks for a full snapshot to resync.
+        """
+        state = self.game_state
+        if not state:
+            return
+        delta = message['delta']
+
+        # Detect a missed delta and fall back to a full resync
+        version = delta.get('version')
+        if version is not None:
+            if version != state.get('version', 0) + 1:
+                self.send_message({'action': 'get_game_state', 'game_id': self.game_id})
+                return
+            state['version'] = version
+
+        # Patch the changed cells in the state grid and the packed grid
+        grid = state['grid']
+        owner_index = {p['id']: i for i, p in enumerate(state['players'])}
+        fences, owners, types = self._packed_grid
+        for update in delta.get('changed_cells', []):
+            ux, uy = update['x'], update['y']
+            cell = grid[uy][ux]
+            mask = fences[uy][ux]
+            for key, bit in FENCE_BITS.items():
+                if key in update:
+                    cell[key] = update[key]
+                    mask = mask | bit if update[key] else mask & ~bit
+            fences[uy][ux] = mask
+            if 'owner' in update:
+                cell['owner'] = update['owner']
+                owners[uy][ux] = owner_index.get(update['owner'], -1)
+
+        # Scores, turn and end-of-game updates
+        for pid, score in delta.get('score_updates', {}).items():
+            for player in state['players']:
+                if player['id'] == pid:
+                    player['score'] = score
+        if 'current_player_index' in delta:
+            state['current_player_index'] = delta['current_player_index']
+        if 'game_over' in delta:
+            state['game_over'] = delta['game_over']
+        if 'winner' in delta:
+            state['winner'] = delta['winner']
+
+        self._gs_version += 1  # Player score lines need reformatting
+
+    def _on_username(self, message):
+        """Record a successful login"""
+        self.logged_in = True
+        self.username = message['username']
+        self.add_message(f"Successfully logged in as {self.username}", 2)
+
+    def _on_stats(self, message):
+        """Show player statistics"""
+        stats = message['stats']
+        self.add_message(f"Player: {stats['name']}", 2)
+        self.add_message(f"Wins: {stats['wins']}, Losses: {stats['losses']}, Draws: {stats['draws']}", 2)
+
+    def _on_recordings(self, message):
+        """Show the list of available recordings"""
+        self.recordings = message['recordings']
+        self.display_recordings()
+
+    def _on_recording(self, message):
+        """Start replaying a downloaded recording"""
+        self.start_replay(message['recording'])
     
     def initialize_ui(self):
         """Initialize the curses UI"""
@@ -165,6 +407,9 @@ class ProspectorClient:
         curses.noecho()
         curses.cbreak()
         self.screen.keypad(True)
+        # getch() never blocks; the main loop paces itself in select() on
+        # stdin and the wake pipe instead
+        self.screen.timeout(0)
         
         # Get screen dimensions
         self.height, self.width = self.screen.getmaxyx()
@@ -178,6 +423,13 @@ class ProspectorClient:
         curses.init_pair(6, curses.COLOR_BLUE, curses.COLOR_BLACK)   # Highlight
         curses.init_pair(7, curses.COLOR_MAGENTA, curses.COLOR_BLACK) # Gold land
         curses.init_pair(8, curses.COLOR_RED, curses.COLOR_BLACK)    # Copper land
+
+        # Cache the color-pair attributes once; color_pair() is a pure
+        # function of the index but gets called hundreds of times per frame
+        self._cp = [curses.color_pair(i) for i in range(9)]
+
+        # The static header is rendered once into a pad and blitted per frame
+        self._render_header()
     
     def cleanup_ui(self):
         """Clean up the curses UI"""
@@ -190,8 +442,13 @@ class ProspectorClient:
     def add_message(self, message, color=1):
         """Add a message to the message queue"""
         self.messages.append((message, color))
-        if len(self.messages) > 5:
-            self.messages.pop(0)
+        self.dirty = True
+
+    def handle_resize(self):
+        """Recompute cached screen dimensions after a terminal resize"""
+        self.height, self.width = self.screen.getmaxyx()
+        self._render_header()
+        self.dirty = True
     
     def start(self):
         """Start the client"""
@@ -213,39 +470,94 @@ class ProspectorClient:
             # Main loop
             while self.running:
                 try:
-                    # Clear screen
-                    self.screen.clear()
-                    
-                    # Display header
-                    self.display_header()
-                    
-                    # Handle different UI states
-                    if self.input_mode:
-                        self.handle_input_mode()
-                    elif self.replay_mode:
-                        self.display_replay()
-                        self.handle_replay_input()
-                    elif self.game_state:
-                        self.display_game()
-                        self.handle_game_input()
-                    else:
-                        self.display_menu()
-                        self.handle_menu_input()
-                    
-                    # Display messages
-                    self.display_messages()
-                    
-                    # Refresh screen
-                    self.screen.refresh()
-                    
-                    # Small delay
-                    time.sleep(0.05)
+                    # Drain any messages queued by the receiver thread
+                    while True:
+                        try:
+                            message = self.inbox.get_nowait()
+                        except queue.Empty:
+                            break
+                        self.handle_server_message(message)
+                        self.dirty = True
+
+                    # Replay playback advances on a timer, so keep redrawing
+                    if self.replay_mode and not self.replay_paused:
+                        self.dirty = True
+
+                    # The turn countdown changes once a second even with no
+                    # input or server traffic; redraw when the displayed
+                    # integer would change so it keeps ticking
+                    if (self.game_state and not self.replay_mode
+                            and not self.input_mode
+                            and not self.game_state.get('game_over')):
+                        turn_start_time = self.game_state.get('turn_start_time', time.time())
+                        turn_time_limit = self.game_state.get('turn_time_limit', 60)
+                        remaining = max(0, turn_time_limit - (time.time() - turn_start_time))
+                        if int(remaining) != self._drawn_timer:
+                            self.dirty = True
+
+                    # Redraw only when something changed
+                    if self.dirty:
+                        if self.input_mode:
+                            view = 'input'
+                        elif self.replay_mode:
+                            view = 'replay'
+                        elif self.game_state:
+                            view = 'game'
+                        else:
+                            view = 'menu'
+
+                        # Erase only when switching views; within a view the
+                        # draws overwrite their lines in place and curses'
+                        # virtual-screen diff emits just the changed cells
+                        if view != self._last_view:
+                            self.screen.erase()
+                            self._last_view = view
+
+                        if view == 'replay':
+                            self.display_replay()
+                        elif view == 'game':
+                            self.display_game()
+                        elif view == 'menu':
+                            self.display_menu()
+
+                        self.display_messages()
+                        if view == 'input':
+                            # Last so the cursor lands in the input field
+                            self.draw_input_prompt()
+                        self.refresh()
+                        self.dirty = False
+
+                    # Block until a key or a server message arrives instead of
+                    # sleeping a fixed 50 ms; replay keeps a short tick so
+                    # moves advance without input
+                    wait = 0.05 if (self.replay_mode and not self.replay_paused) else 0.5
+                    readable, _, _ = select.select([sys.stdin, self.wake_r], [], [], wait)
+                    if self.wake_r in readable:
+                        os.read(self.wake_r, 4096)  # Drain the wake pipe
+
+                    # Drain every pending key before the next redraw, so a
+                    # typing or paste burst is applied in a single frame.
+                    # The UI state is re-checked per key: a handler may
+                    # switch modes (open a prompt, leave the game) mid-burst
+                    while True:
+                        key = self.screen.getch()
+                        if key == -1:
+                            break
+                        self.dirty = True
+                        if self.input_mode:
+                            self.handle_input_mode(key)
+                        elif self.replay_mode:
+                            self.handle_replay_input(key)
+                        elif self.game_state:
+                            self.handle_game_input(key)
+                        else:
+                            self.handle_menu_input(key)
                 
                 except curses.error:
                     # Handle curses errors (usually from drawing outside the window)
                     pass
                 except Exception as e:
-                    print(f"Error in main loop: {e}")
+                    logger.error("error in main loop: %s", e)
                     self.add_message(f"Error: {e}", 3)
             
         except Exception as e:
@@ -263,15 +575,25 @@ class ProspectorClient:
             
             self.cleanup_ui()
     
-    def display_header(self):
-        """Display the game header"""
+    def _render_header(self):
+        """Render the static header into its cached pad
+
+        The title, subtitle and separator never change at runtime, so they
+        are drawn once here and only blitted on each refresh; re-rendered on
+        resize alone.
+        """
         title = "PROSPECTOR"
-        self.screen.addstr(1, (self.width - len(title)) // 2, title, curses.A_BOLD)
-        
         subtitle = f"Produced by {self.student_id1} and {self.student_id2} for assessment 2 of CS5003"
-        self.screen.addstr(2, (self.width - len(subtitle)) // 2, subtitle)
-        
-        self.screen.addstr(3, 0, "-" * self.width)
+        self._header_pad = curses.newpad(3, max(self.width, len(subtitle) + 2) + 1)
+        self._header_pad.addstr(0, max(0, (self.width - len(title)) // 2), title, curses.A_BOLD)
+        self._header_pad.addstr(1, max(0, (self.width - len(subtitle)) // 2), subtitle)
+        self._header_pad.addstr(2, 0, "-" * self.width)
+
+    def refresh(self):
+        """Flush pending drawing and the cached header in one doupdate"""
+        self.screen.noutrefresh()
+        self._header_pad.noutrefresh(0, 0, 1, 0, min(3, self.height - 1), self.width - 1)
+        curses.doupdate()
     
     def display_messages(self):
         """Display the message queue"""
@@ -279,7 +601,8 @@ class ProspectorClient:
         self.screen.addstr(message_y - 1, 1, "Messages:")
         
         for i, (msg, color) in enumerate(self.messages):
-            self.screen.addstr(message_y + i, 1, msg[:self.width-2], curses.color_pair(color))
+            self.screen.addstr(message_y + i, 1,
+                               msg.ljust(self.width - 2)[:self.width - 2], self._cp[color])
     
     def display_menu(self):
         """Display the main menu"""
@@ -294,9 +617,9 @@ class ProspectorClient:
         
         for i, option in enumerate(self.menu_options):
             if i == self.menu_position:
-                self.screen.addstr(menu_y + i + 2, 4, f"> {option}", curses.color_pair(6) | curses.A_BOLD)
+                self.screen.addstr(menu_y + i + 2, 4, f"> {option}".ljust(40), self._cp[6] | curses.A_BOLD)
             else:
-                self.screen.addstr(menu_y + i + 2, 4, f"  {option}")
+                self.screen.addstr(menu_y + i + 2, 4, f"  {option}".ljust(40))
         
         self.screen.addstr(menu_y + len(self.menu_options) + 3, 2, "Use arrow keys to navigate, Enter to select")
     
@@ -306,18 +629,24 @@ class ProspectorClient:
             return
         
         # Game info
+        now = time.time()  # One clock read per frame
+
         game_info_y = 5
         self.screen.addstr(game_info_y, 2, f"Game ID: {self.game_state['game_id']}")
         
-        # Player information
+        # Player information; the formatted lines are rebuilt only when a
+        # new game_state arrives, not on every frame
         player_info_y = game_info_y + 2
         self.screen.addstr(player_info_y, 2, "Players:")
-        
-        for i, player in enumerate(self.game_state['players']):
+
+        if self._player_lines_version != self._gs_version:
+            self._player_lines = [f"{p['name']} - Score: {p['score']}"
+                                  for p in self.game_state['players']]
+            self._player_lines_version = self._gs_version
+
+        for i, line in enumerate(self._player_lines):
             color = 4 if i == 0 else 5  # Player colors
-            self.screen.addstr(player_info_y + i + 1, 4, 
-                             f"{player['name']} - Score: {player['score']}", 
-                             curses.color_pair(color))
+            self.screen.addstr(player_info_y + i + 1, 4, line, self._cp[color])
         
         # Current player
         if 'current_player_index' in self.game_state and len(self.game_state['players']) > 0:
@@ -325,21 +654,21 @@ class ProspectorClient:
             if current_index < len(self.game_state['players']):
                 current_player = self.game_state['players'][current_index]
                 current_y = player_info_y + len(self.game_state['players']) + 2
-                self.screen.addstr(current_y, 2, f"Current turn: {current_player['name']}")
+                self.screen.addstr(current_y, 2, f"Current turn: {current_player['name']}".ljust(40))
                 
                 # Display timer
                 if not self.game_state['game_over']:
-                    current_time = time.time()
-                    turn_start_time = self.game_state.get('turn_start_time', current_time)
+                    turn_start_time = self.game_state.get('turn_start_time', now)
                     turn_time_limit = self.game_state.get('turn_time_limit', 60)
-                    
-                    elapsed = current_time - turn_start_time
+
+                    elapsed = now - turn_start_time
                     remaining = max(0, turn_time_limit - elapsed)
                     
                     timer_y = current_y + 1
                     timer_color = 3 if remaining < 10 else 1  # Red if less than 10 seconds
-                    self.screen.addstr(timer_y, 2, f"Time remaining: {int(remaining)} seconds", 
-                                     curses.color_pair(timer_color))
+                    self.screen.addstr(timer_y, 2, f"Time remaining: {int(remaining)} seconds".ljust(40),
+                                     self._cp[timer_color])
+                    self._drawn_timer = int(remaining)
         
         # Draw grid
         grid_y = player_info_y + len(self.game_state['players']) + 6
@@ -350,130 +679,155 @@ class ProspectorClient:
         status_y = grid_y + self.game_state['grid_size'] * 2 + 2
         if self.game_state['game_over']:
             if self.game_state['winner'] == 'draw':
-                self.screen.addstr(status_y, 2, "Game Over - It's a draw!", curses.color_pair(6))
+                self.screen.addstr(status_y, 2, "Game Over - It's a draw!", self._cp[6])
             else:
                 winner = next((p['name'] for p in self.game_state['players'] if p['id'] == self.game_state['winner']), "Unknown")
-                self.screen.addstr(status_y, 2, f"Game Over - Winner: {winner}", curses.color_pair(2))
+                self.screen.addstr(status_y, 2, f"Game Over - Winner: {winner}", self._cp[2])
         
         # Controls
         controls_y = status_y + 2
         self.screen.addstr(controls_y, 2, "Controls: Arrow keys to move, Space to change orientation, Enter to place fence, Q to quit")
-        self.screen.addstr(controls_y + 1, 2, f"Selected orientation: {self.selected_orientation}")
+        self.screen.addstr(controls_y + 1, 2, f"Selected orientation: {self.selected_orientation}".ljust(40))
         
         # Land types legend
         legend_y = controls_y + 3
-        self.screen.addstr(legend_y, 2, "Land Types: Regular=1pt, C=Copper (2pts), G=Gold (3pts)", curses.color_pair(1))
+        self.screen.addstr(legend_y, 2, "Land Types: Regular=1pt, C=Copper (2pts), G=Gold (3pts)", self._cp[1])
     
     def draw_grid(self, start_y, start_x):
-        """Draw the game grid"""
-        if not self.game_state or 'grid' not in self.game_state:
+        """Draw the game grid
+
+        Works on the packed int grids built once per game_state update, so
+        the inner loop is bit tests and list indexing. Each text row is
+        emitted with a single addstr; colored cells and the cursor highlight
+        are overlaid afterwards.
+        """
+        if not self.game_state or self._packed_grid is None:
             return
-        
-        grid = self.game_state['grid']
+
+        fences, owners, types = self._packed_grid
         grid_size = self.game_state['grid_size']
         cell_width = 4
-        
-        # Land type indicators and colors
-        land_type_chars = {
-            "regular": " ",
-            "copper": "C",
-            "gold": "G"
-        }
-        
-        land_type_colors = {
-            "regular": 1,
-            "copper": 8,
-            "gold": 7
-        }
-        
+
+        # Owner indices mapped to their color/letter
+        owner_render = [(4, 'A') if i == 0 else (5, 'B')
+                        for i in range(len(self.game_state['players']))]
+
+        overlays = []  # (y, x, text, attr) drawn on top of the plain rows
         for y in range(grid_size):
+            fence_row = fences[y]
+            owner_row = owners[y]
+            type_row = types[y]
+            top_parts = []
+            mid_parts = []
             for x in range(grid_size):
-                cell = grid[y][x]
-                cell_y = start_y + y * 2
-                cell_x = start_x + x * cell_width
-                
-                # Draw north fence
-                north_char = '---' if cell.get('north', False) else '   '
-                if y == self.cursor_y and x == self.cursor_x and self.selected_orientation == 'north':
-                    self.screen.addstr(cell_y, cell_x, north_char, curses.color_pair(6) | curses.A_BOLD)
-                else:
-                    self.screen.addstr(cell_y, cell_x, north_char)
-                
-                # Draw west fence
-                west_char = '|' if cell.get('west', False) else ' '
-                if y == self.cursor_y and x == self.cursor_x and self.selected_orientation == 'west':
-                    self.screen.addstr(cell_y + 1, cell_x - 1, west_char, curses.color_pair(6) | curses.A_BOLD)
-                else:
-                    self.screen.addstr(cell_y + 1, cell_x - 1, west_char)
-                
-                # Draw cell content (owner indicator or land type)
-                land_type = cell.get('type', 'regular')
-                cell_content = land_type_chars.get(land_type, ' ')
-                cell_color = land_type_colors.get(land_type, 1)
-                
-                if cell.get('owner') is not None:
-                    # Find owner in players list
-                    for i, player in enumerate(self.game_state['players']):
-                        if player['id'] == cell['owner']:
-                            cell_color = 4 if i == 0 else 5
-                            cell_content = 'A' if i == 0 else 'B'
-                            break
-                
-                self.screen.addstr(cell_y + 1, cell_x + 1, cell_content, curses.color_pair(cell_color))
-                
-                # Draw east fence
-                east_char = '|' if cell.get('east', False) else ' '
-                if y == self.cursor_y and x == self.cursor_x and self.selected_orientation == 'east':
-                    self.screen.addstr(cell_y + 1, cell_x + 3, east_char, curses.color_pair(6) | curses.A_BOLD)
-                else:
-                    self.screen.addstr(cell_y + 1, cell_x + 3, east_char)
-                
-                # Draw south fence
-                south_char = '---' if cell.get('south', False) else '   '
-                if y == self.cursor_y and x == self.cursor_x and self.selected_orientation == 'south':
-                    self.screen.addstr(cell_y + 2, cell_x, south_char, curses.color_pair(6) | curses.A_BOLD)
-                else:
-                    self.screen.addstr(cell_y + 2, cell_x, south_char)
+                mask = fence_row[x]
+                top_parts.append('---' if mask & FENCE_NORTH else '   ')
+                mid_parts.append('|' if mask & FENCE_WEST else ' ')
+
+                # Cell content (owner indicator or land type)
+                land_type = type_row[x]
+                cell_content = TYPE_CHARS[land_type]
+                cell_color = TYPE_COLORS[land_type]
+
+                owner = owner_row[x]
+                if owner >= 0:
+                    cell_color, cell_content = owner_render[owner]
+
+                if cell_color != 1:
+                    overlays.append((start_y + y * 2 + 1, start_x + x * cell_width + 1,
+                                     cell_content, self._cp[cell_color]))
+                mid_parts.append(' ' + cell_content + ' ')
+            mid_parts.append('|' if fence_row[grid_size - 1] & FENCE_EAST else ' ')
+
+            self.screen.addstr(start_y + y * 2, start_x, ' '.join(top_parts))
+            self.screen.addstr(start_y + y * 2 + 1, start_x - 1, ''.join(mid_parts))
+
+        # Bottom border from the last row's south fences
+        bottom = ' '.join('---' if mask & FENCE_SOUTH else '   '
+                          for mask in fences[grid_size - 1])
+        self.screen.addstr(start_y + grid_size * 2, start_x, bottom)
+
+        for oy, ox, text, attr in overlays:
+            self.screen.addstr(oy, ox, text, attr)
+
+        # Highlight the selected fence of the cursor cell
+        cy, cx = self.cursor_y, self.cursor_x
+        mask = fences[cy][cx]
+        highlight = self._cp[6] | curses.A_BOLD
+        if self.selected_orientation == 'north':
+            self.screen.addstr(start_y + cy * 2, start_x + cx * cell_width,
+                               '---' if mask & FENCE_NORTH else '   ', highlight)
+        elif self.selected_orientation == 'south':
+            self.screen.addstr(start_y + cy * 2 + 2, start_x + cx * cell_width,
+                               '---' if mask & FENCE_SOUTH else '   ', highlight)
+        elif self.selected_orientation == 'west':
+            self.screen.addstr(start_y + cy * 2 + 1, start_x + cx * cell_width - 1,
+                               '|' if mask & FENCE_WEST else ' ', highlight)
+        else:  # east
+            self.screen.addstr(start_y + cy * 2 + 1, start_x + cx * cell_width + 3,
+                               '|' if mask & FENCE_EAST else ' ', highlight)
     
     def display_recordings(self):
         """Display the list of available recordings"""
-        self.screen.clear()
-        self.display_header()
-        
+        # This modal loop paces itself on getch(), so block for keys here
+        # and restore the non-blocking main-loop setting on exit
+        self.screen.timeout(-1)
+        try:
+            self._display_recordings()
+        finally:
+            self.screen.timeout(0)
+            self.dirty = True
+
+    def _render_recording_row(self, i, selected):
+        """Render one row of the recordings list"""
+        recording = self.recordings[i]
+        players_str = ", ".join(recording.get("players", []))
+        created_at = recording.get("created_at", "Unknown")
+        marker = ">" if selected else " "
+        attr = self._cp[6] | curses.A_BOLD if selected else curses.A_NORMAL
+        self.screen.addstr(7 + i, 4,
+                           f"{marker} Game {i+1}: {players_str} - {created_at}", attr)
+
+    def _render_recordings(self):
+        """Render the full recordings list"""
+        self.screen.erase()
+
+        recording_y = 5
+        self.screen.addstr(recording_y, 2, "Available Game Recordings:")
+
+        for i in range(len(self.recordings)):
+            self._render_recording_row(i, i == self.recording_position)
+
+        self.screen.addstr(recording_y + len(self.recordings) + 3, 2,
+                         "Use arrow keys to navigate, Enter to select, Q to return to menu")
+        self.refresh()
+
+    def _display_recordings(self):
+        """Run the recordings list input loop"""
         if not self.recordings:
+            self.screen.erase()
             self.screen.addstr(5, 2, "No recordings available")
             self.screen.addstr(7, 2, "Press any key to return to the menu")
-            self.screen.refresh()
+            self.refresh()
             self.screen.getch()
             return
-        
-        recording_y = 5
-        self.screen.addstr(recording_y, 2, "Available Game Recordings:")
-        
-        for i, recording in enumerate(self.recordings):
-            players_str = ", ".join(recording.get("players", []))
-            created_at = recording.get("created_at", "Unknown")
-            
-            if i == self.recording_position:
-                self.screen.addstr(recording_y + i + 2, 4, 
-                                 f"> Game {i+1}: {players_str} - {created_at}", 
-                                 curses.color_pair(6) | curses.A_BOLD)
-            else:
-                self.screen.addstr(recording_y + i + 2, 4, 
-                                 f"  Game {i+1}: {players_str} - {created_at}")
-        
-        self.screen.addstr(recording_y + len(self.recordings) + 3, 2, 
-                         "Use arrow keys to navigate, Enter to select, Q to return to menu")
-        
-        # Handle input
-        self.screen.refresh()
+
+        self._render_recordings()
         while True:
             key = self.screen.getch()
-            
-            if key == curses.KEY_UP:
-                self.recording_position = max(0, self.recording_position - 1)
-            elif key == curses.KEY_DOWN:
-                self.recording_position = min(len(self.recordings) - 1, self.recording_position + 1)
+
+            if key == curses.KEY_UP or key == curses.KEY_DOWN:
+                old_pos = self.recording_position
+                if key == curses.KEY_UP:
+                    self.recording_position = max(0, old_pos - 1)
+                else:
+                    self.recording_position = min(len(self.recordings) - 1, old_pos + 1)
+
+                # Repaint only the two rows whose highlight changed
+                if self.recording_position != old_pos:
+                    self._render_recording_row(old_pos, False)
+                    self._render_recording_row(self.recording_position, True)
+                    self.refresh()
             elif key == 10:  # Enter key
                 # Get selected recording
                 if 0 <= self.recording_position < len(self.recordings):
@@ -483,30 +837,11 @@ class ProspectorClient:
                         "game_id": game_id
                     })
                     return
+            elif key == curses.KEY_RESIZE:
+                self.handle_resize()
+                self._render_recordings()
             elif key == ord('q') or key == ord('Q'):
                 return
-            
-            # Update display
-            self.screen.clear()
-            self.display_header()
-            self.screen.addstr(recording_y, 2, "Available Game Recordings:")
-            
-            for i, recording in enumerate(self.recordings):
-                players_str = ", ".join(recording.get("players", []))
-                created_at = recording.get("created_at", "Unknown")
-                
-                if i == self.recording_position:
-                    self.screen.addstr(recording_y + i + 2, 4, 
-                                     f"> Game {i+1}: {players_str} - {created_at}", 
-                                     curses.color_pair(6) | curses.A_BOLD)
-                else:
-                    self.screen.addstr(recording_y + i + 2, 4, 
-                                     f"  Game {i+1}: {players_str} - {created_at}")
-            
-            self.screen.addstr(recording_y + len(self.recordings) + 3, 2, 
-                             "Use arrow keys to navigate, Enter to select, Q to return to menu")
-            
-            self.screen.refresh()
     
     def start_replay(self, recording):
         """Start replaying a recorded game"""
@@ -519,32 +854,28 @@ class ProspectorClient:
         self.replay_index = 0
         self.replay_paused = False
         self.replay_recording = recording
+
+        # Map player ids to names once instead of scanning the recording for
+        # every score line drawn
+        self.replay_player_names = {
+            move.get("player_id"): move.get("player_name", "Unknown")
+            for move in recording
+        }
         
         # Initialize grid based on first move
         if len(recording) > 0:
-            first_move = recording[0]
             grid_size = 5  # Default
-            
-            # Create a blank grid
-            grid = []
-            for y in range(grid_size):
-                row = []
-                for x in range(grid_size):
-                    cell = {
-                        "north": False,
-                        "east": False,
-                        "south": False,
-                        "west": False,
-                        "owner": None,
-                        "type": "regular",
-                        "value": 1
-                    }
-                    row.append(cell)
-                grid.append(row)
-            
-            self.replay_grid = grid
+
+            # Blank packed grids: fence masks and owner indices per cell
+            self.replay_fences = [[0] * grid_size for _ in range(grid_size)]
+            self.replay_owners = [[-1] * grid_size for _ in range(grid_size)]
             self.replay_scores = {}
-            
+            self._replay_owner_index = {}  # player_id -> packed owner index
+
+            # Moves are applied when the monotonic clock passes this mark,
+            # so the render loop never sleeps
+            self._next_move_at = time.monotonic() + 0.5
+
             self.add_message("Starting replay. Space to pause/resume, Q to quit", 2)
         else:
             self.add_message("Empty recording", 3)
@@ -558,8 +889,7 @@ class ProspectorClient:
         # Display replay header
         self.screen.addstr(5, 2, "GAME REPLAY", curses.A_BOLD)
         
-        if self.replay_paused:
-            self.screen.addstr(6, 2, "PAUSED", curses.color_pair(3))
+        self.screen.addstr(6, 2, "PAUSED" if self.replay_paused else "      ", self._cp[3])
         
         # Display current move
         move_y = 8
@@ -570,11 +900,11 @@ class ProspectorClient:
             orientation = move.get("orientation", "unknown")
             land_claimed = move.get("land_claimed", False)
             
-            self.screen.addstr(move_y, 2, f"Move {self.replay_index + 1}/{len(self.replay_recording)}")
-            self.screen.addstr(move_y + 1, 2, f"Player: {player_name}")
-            self.screen.addstr(move_y + 2, 2, f"Position: ({position.get('x', '?')}, {position.get('y', '?')})")
-            self.screen.addstr(move_y + 3, 2, f"Orientation: {orientation}")
-            self.screen.addstr(move_y + 4, 2, f"Land claimed: {'Yes' if land_claimed else 'No'}")
+            self.screen.addstr(move_y, 2, f"Move {self.replay_index + 1}/{len(self.replay_recording)}".ljust(40))
+            self.screen.addstr(move_y + 1, 2, f"Player: {player_name}".ljust(40))
+            self.screen.addstr(move_y + 2, 2, f"Position: ({position.get('x', '?')}, {position.get('y', '?')})".ljust(40))
+            self.screen.addstr(move_y + 3, 2, f"Orientation: {orientation}".ljust(40))
+            self.screen.addstr(move_y + 4, 2, f"Land claimed: {'Yes' if land_claimed else 'No'}".ljust(40))
         
         # Display player scores
         score_y = move_y + 6
@@ -582,11 +912,8 @@ class ProspectorClient:
         
         score_row = 1
         for player_id, score in self.replay_scores.items():
-            # Find player name
-            player_name = next((move.get("player_name") for move in self.replay_recording 
-                             if move.get("player_id") == player_id), "Unknown")
-            
-            self.screen.addstr(score_y + score_row, 4, f"{player_name}: {score}")
+            player_name = self.replay_player_names.get(player_id, "Unknown")
+            self.screen.addstr(score_y + score_row, 4, f"{player_name}: {score}".ljust(30))
             score_row += 1
         
         # Draw grid
@@ -598,58 +925,53 @@ class ProspectorClient:
         controls_y = grid_y + 12
         self.screen.addstr(controls_y, 2, "Controls: Space to pause/resume, Q to quit")
         
-        # Apply current move
-        if not self.replay_paused and self.replay_index < len(self.replay_recording):
-            time.sleep(0.5)  # Delay between moves
+        # Apply the next move once its time arrives; no sleeping in the
+        # render path, so pause/quit keys stay responsive
+        if (not self.replay_paused and self.replay_index < len(self.replay_recording)
+                and time.monotonic() >= self._next_move_at):
             self.apply_replay_move()
+            self._next_move_at = time.monotonic() + 0.5
     
     def draw_replay_grid(self, start_y, start_x):
-        """Draw the replay grid"""
-        if not hasattr(self, 'replay_grid'):
+        """Draw the replay grid one row-string at a time with color overlays"""
+        if not hasattr(self, 'replay_fences'):
             return
-        
-        grid = self.replay_grid
-        grid_size = len(grid)
+
+        fences = self.replay_fences
+        owners = self.replay_owners
+        grid_size = len(fences)
         cell_width = 4
-        
+
+        overlays = []  # (y, x, text, attr) drawn on top of the plain rows
         for y in range(grid_size):
+            fence_row = fences[y]
+            owner_row = owners[y]
+            top_parts = []
+            mid_parts = []
             for x in range(grid_size):
-                cell = grid[y][x]
-                cell_y = start_y + y * 2
-                cell_x = start_x + x * cell_width
-                
-                # Draw north fence
-                north_char = '---' if cell.get('north', False) else '   '
-                self.screen.addstr(cell_y, cell_x, north_char)
-                
-                # Draw west fence
-                west_char = '|' if cell.get('west', False) else ' '
-                self.screen.addstr(cell_y + 1, cell_x - 1, west_char)
-                
-                # Draw cell content (owner)
+                mask = fence_row[x]
+                top_parts.append('---' if mask & FENCE_NORTH else '   ')
+                mid_parts.append('|' if mask & FENCE_WEST else ' ')
+
                 cell_content = ' '
-                cell_color = 1
-                
-                if cell.get('owner') is not None:
-                    # In replay we don't have player objects, so use simple A/B
-                    player_index = 0
-                    for i, player_id in enumerate(self.replay_scores.keys()):
-                        if player_id == cell.get('owner'):
-                            player_index = i
-                            break
-                    
-                    cell_content = chr(65 + player_index)  # A, B, C, etc.
-                    cell_color = 4 if player_index == 0 else 5
-                
-                self.screen.addstr(cell_y + 1, cell_x + 1, cell_content, curses.color_pair(cell_color))
-                
-                # Draw east fence
-                east_char = '|' if cell.get('east', False) else ' '
-                self.screen.addstr(cell_y + 1, cell_x + 3, east_char)
-                
-                # Draw south fence
-                south_char = '---' if cell.get('south', False) else '   '
-                self.screen.addstr(cell_y + 2, cell_x, south_char)
+                i = owner_row[x]
+                if i >= 0:
+                    cell_content = chr(65 + i)  # A, B, C, etc.
+                    overlays.append((start_y + y * 2 + 1, start_x + x * cell_width + 1,
+                                     cell_content, self._cp[4 if i == 0 else 5]))
+                mid_parts.append(' ' + cell_content + ' ')
+            mid_parts.append('|' if fence_row[grid_size - 1] & FENCE_EAST else ' ')
+
+            self.screen.addstr(start_y + y * 2, start_x, ' '.join(top_parts))
+            self.screen.addstr(start_y + y * 2 + 1, start_x - 1, ''.join(mid_parts))
+
+        # Bottom border from the last row's south fences
+        bottom = ' '.join('---' if mask & FENCE_SOUTH else '   '
+                          for mask in fences[grid_size - 1])
+        self.screen.addstr(start_y + grid_size * 2, start_x, bottom)
+
+        for oy, ox, text, attr in overlays:
+            self.screen.addstr(oy, ox, text, attr)
     
     def apply_replay_move(self):
         """Apply the current move in the replay"""
@@ -668,29 +990,31 @@ class ProspectorClient:
         if x is None or y is None or orientation is None:
             self.replay_index += 1
             return
-        
-        # Place fence
-        cell = self.replay_grid[y][x]
-        cell[orientation] = True
-        
+
+        # Place fence with a bitwise OR on the packed mask
+        grid_size = len(self.replay_fences)
+        self.replay_fences[y][x] |= FENCE_BITS.get(orientation, 0)
+
         # Update adjacent cell
         if orientation == "north" and y > 0:
-            self.replay_grid[y-1][x]["south"] = True
-        elif orientation == "east" and x < len(self.replay_grid) - 1:
-            self.replay_grid[y][x+1]["west"] = True
-        elif orientation == "south" and y < len(self.replay_grid) - 1:
-            self.replay_grid[y+1][x]["north"] = True
+            self.replay_fences[y-1][x] |= FENCE_SOUTH
+        elif orientation == "east" and x < grid_size - 1:
+            self.replay_fences[y][x+1] |= FENCE_WEST
+        elif orientation == "south" and y < grid_size - 1:
+            self.replay_fences[y+1][x] |= FENCE_NORTH
         elif orientation == "west" and x > 0:
-            self.replay_grid[y][x-1]["east"] = True
-        
+            self.replay_fences[y][x-1] |= FENCE_EAST
+
         # If land claimed, update owner
         if land_claimed:
-            cell["owner"] = player_id
-            
+            if player_id not in self._replay_owner_index:
+                self._replay_owner_index[player_id] = len(self._replay_owner_index)
+            self.replay_owners[y][x] = self._replay_owner_index[player_id]
+
             # Update score
             if player_id not in self.replay_scores:
                 self.replay_scores[player_id] = 0
-            
+
             self.replay_scores[player_id] += 1
         
         # Move to next move
@@ -700,13 +1024,15 @@ class ProspectorClient:
         if self.replay_index >= len(self.replay_recording):
             self.add_message("Replay complete", 2)
     
-    def handle_replay_input(self):
-        """Handle input during replay"""
-        key = self.screen.getch()
-        
-        if key == ord(' '):
+    def handle_replay_input(self, key):
+        """Handle a key press during replay"""
+        if key == curses.KEY_RESIZE:
+            self.handle_resize()
+        elif key == ord(' '):
             # Toggle pause/resume
             self.replay_paused = not self.replay_paused
+            if not self.replay_paused:
+                self._next_move_at = time.monotonic() + 0.5
             status = "paused" if self.replay_paused else "resumed"
             self.add_message(f"Replay {status}", 2)
         elif key == ord('q') or key == ord('Q'):
@@ -714,11 +1040,11 @@ class ProspectorClient:
             self.replay_mode = False
             self.add_message("Replay ended", 2)
     
-    def handle_menu_input(self):
-        """Handle input in menu mode"""
-        key = self.screen.getch()
-        
-        if key == curses.KEY_UP:
+    def handle_menu_input(self, key):
+        """Handle a key press in menu mode"""
+        if key == curses.KEY_RESIZE:
+            self.handle_resize()
+        elif key == curses.KEY_UP:
             self.menu_position = max(0, self.menu_position - 1)
         elif key == curses.KEY_DOWN:
             self.menu_position = min(len(self.menu_options) - 1, self.menu_position + 1)
@@ -727,12 +1053,13 @@ class ProspectorClient:
         elif key == ord('q') or key == ord('Q'):
             self.running = False
     
-    def handle_game_input(self):
-        """Handle input in game mode"""
-        key = self.screen.getch()
+    def handle_game_input(self, key):
+        """Handle a key press in game mode"""
         grid_size = self.game_state.get('grid_size', 5)
-        
-        if key == curses.KEY_UP:
+
+        if key == curses.KEY_RESIZE:
+            self.handle_resize()
+        elif key == curses.KEY_UP:
             self.cursor_y = max(0, self.cursor_y - 1)
         elif key == curses.KEY_DOWN:
             self.cursor_y = min(grid_size - 1, self.cursor_y + 1)
@@ -742,9 +1069,7 @@ class ProspectorClient:
             self.cursor_x = min(grid_size - 1, self.cursor_x + 1)
         elif key == ord(' '):
             # Cycle through orientations
-            orientations = ['north', 'east', 'south', 'west']
-            current_index = orientations.index(self.selected_orientation)
-            self.selected_orientation = orientations[(current_index + 1) % 4]
+            self._orient_idx = (self._orient_idx + 1) & 3
         elif key == 10:  # Enter key
             # Place fence
             self.send_message({
@@ -769,17 +1094,29 @@ class ProspectorClient:
         self.input_prompt = prompt
         self.input_buffer = ""
         self.input_callback = callback
+        self._last_input_len = -1
+        self.dirty = True
         curses.curs_set(1)  # Show cursor
     
-    def handle_input_mode(self):
-        """Handle input in text input mode"""
-        # Display the prompt and current input
-        self.screen.addstr(self.height - 3, 1, self.input_prompt + " " * 40)
-        self.screen.addstr(self.height - 2, 1, self.input_buffer + "_" + " " * 40)
-        self.screen.move(self.height - 2, 1 + len(self.input_buffer))
-        
-        key = self.screen.getch()
-        
+    def draw_input_prompt(self):
+        """Draw the prompt line and echo the current input buffer
+
+        The prompt is drawn once per prompt_input; after that only the
+        typed characters plus enough trailing spaces to cover a backspace
+        are written.
+        """
+        cur = len(self.input_buffer)
+        if self._last_input_len < 0:
+            self.screen.addstr(self.height - 3, 1, self.input_prompt)
+            self._last_input_len = 0
+        pad = max(0, self._last_input_len - cur)
+        self.screen.addnstr(self.height - 2, 1, self.input_buffer + "_" + " " * pad,
+                            cur + 1 + pad)
+        self._last_input_len = cur
+        self.screen.move(self.height - 2, 1 + cur)
+    
+    def handle_input_mode(self, key):
+        """Handle a key press in text input mode"""
         if key == 10:  # Enter key
             result = self.input_buffer
             self.input_mode = False
@@ -828,31 +1165,53 @@ class ProspectorClient:
     
     def show_login_menu(self):
         """Show the login/register menu"""
+        # Modal loop: block for keys and restore non-blocking getch on exit
+        self.screen.timeout(-1)
+        try:
+            self._show_login_menu()
+        finally:
+            self.screen.timeout(0)
+            self._last_view = None
+            self.dirty = True
+
+    def _show_login_menu(self):
+        """Render the login/register menu and run its input loop
+
+        The menu is drawn once; each keypress repaints only the two rows
+        whose highlight changed instead of clearing the whole screen.
+        """
         login_menu = ["Login", "Register", "Back"]
         login_pos = 0
-        
-        while True:
-            self.screen.clear()
-            self.display_header()
-            
-            menu_y = 5
+        menu_y = 5
+
+        def render_row(i, selected):
+            marker = ">" if selected else " "
+            attr = self._cp[6] | curses.A_BOLD if selected else curses.A_NORMAL
+            self.screen.addstr(menu_y + i + 2, 4, f"{marker} {login_menu[i]}", attr)
+
+        def render_all():
+            self.screen.erase()
             self.screen.addstr(menu_y, 2, "User Authentication:")
-            
-            for i, option in enumerate(login_menu):
-                if i == login_pos:
-                    self.screen.addstr(menu_y + i + 2, 4, f"> {option}", curses.color_pair(6) | curses.A_BOLD)
-                else:
-                    self.screen.addstr(menu_y + i + 2, 4, f"  {option}")
-            
+            for i in range(len(login_menu)):
+                render_row(i, i == login_pos)
             self.display_messages()
-            self.screen.refresh()
-            
+            self.refresh()
+
+        render_all()
+        while True:
             key = self.screen.getch()
-            
-            if key == curses.KEY_UP:
-                login_pos = max(0, login_pos - 1)
-            elif key == curses.KEY_DOWN:
-                login_pos = min(len(login_menu) - 1, login_pos + 1)
+
+            if key == curses.KEY_UP or key == curses.KEY_DOWN:
+                old_pos = login_pos
+                if key == curses.KEY_UP:
+                    login_pos = max(0, login_pos - 1)
+                else:
+                    login_pos = min(len(login_menu) - 1, login_pos + 1)
+
+                if login_pos != old_pos:
+                    render_row(old_pos, False)
+                    render_row(login_pos, True)
+                    self.refresh()
             elif key == 10:  # Enter key
                 if login_pos == 0:  # Login
                     self.prompt_login()
@@ -862,6 +1221,9 @@ class ProspectorClient:
                     return
                 elif login_pos == 2:  # Back
                     return
+            elif key == curses.KEY_RESIZE:
+                self.handle_resize()
+                render_all()
             elif key == ord('q') or key == ord('Q'):
                 return
     
@@ -925,13 +1287,13 @@ class ProspectorClient:
     def on_grid_size(self, size_str):
         """Handle grid size input"""
         grid_size = 5  # Default
-        if size_str and size_str.isdigit():
-            size = int(size_str)
+        try:
+            size = int(size_str.strip())
             if 2 <= size <= 10:
                 grid_size = size
             else:
                 self.add_message("Invalid grid size. Using default (5).", 3)
-        else:
+        except (AttributeError, ValueError):
             self.add_message("Invalid input. Using default grid size (5).", 3)
         
         # Ask for number of players
@@ -940,13 +1302,13 @@ class ProspectorClient:
     def on_num_players(self, num_str, grid_size):
         """Handle number of players input"""
         num_players = 2  # Default
-        if num_str and num_str.isdigit():
-            num = int(num_str)
+        try:
+            num = int(num_str.strip())
             if 2 <= num <= 4:
                 num_players = num
             else:
                 self.add_message("Invalid number of players. Using default (2).", 3)
-        else:
+        except (AttributeError, ValueError):
             self.add_message("Invalid input. Using default (2).", 3)
         
         # Create game
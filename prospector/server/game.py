@@ -1,53 +1,151 @@
 """
 Game logic for Prospector
 """
+import heapq
+import itertools
+import json
 import uuid
 import time
 from datetime import datetime
 import threading
 
+try:
+    # orjson serializes the grid several times faster than the stdlib codec
+    import orjson
+except ImportError:
+    orjson = None
+
+# One background thread drives every turn timer from a shared deadline heap,
+# instead of spawning a threading.Timer thread per turn per game
+_timer_heap = []
+_timer_cv = threading.Condition()
+_timer_seq = itertools.count()  # Heap tiebreaker for equal deadlines
+_timer_thread = None
+
+def _timer_worker():
+    """Fire scheduled timer callbacks as their deadlines pass"""
+    while True:
+        with _timer_cv:
+            while not _timer_heap:
+                _timer_cv.wait()
+            deadline, _, entry = _timer_heap[0]
+            now = time.time()
+            if deadline > now:
+                # A new, earlier deadline wakes the wait via notify()
+                _timer_cv.wait(deadline - now)
+                continue
+            heapq.heappop(_timer_heap)
+            callback = None if entry["cancelled"] else entry["callback"]
+        if callback:
+            callback()
+
+def _schedule_timer(deadline, callback):
+    """Add a callback to the timer heap, starting the worker on first use
+
+    Returns the heap entry; setting its "cancelled" flag descheduled it
+    (lazy deletion — the worker skips cancelled entries when they pop).
+    """
+    global _timer_thread
+    entry = {"callback": callback, "cancelled": False}
+    with _timer_cv:
+        heapq.heappush(_timer_heap, (deadline, next(_timer_seq), entry))
+        if _timer_thread is None:
+            _timer_thread = threading.Thread(target=_timer_worker, daemon=True)
+            _timer_thread.start()
+        _timer_cv.notify()
+    return entry
+
 class Game:
     """Represents a Prospector game instance"""
     
+    # Slots keep many resident games cheap: no per-instance __dict__, and
+    # attribute access on the place_fence hot path is an offset load
+    __slots__ = (
+        'game_id', 'grid_size', 'num_players', 'players',
+        'current_player_index', 'game_over', 'winner', 'created_at',
+        'last_activity', 'turn_time_limit', 'turn_start_time',
+        '_timer_entry', 'timer_active', '_state_version', '_cached_version',
+        '_cached_encoded', 'north', 'east', 'south', 'west', 'owner_mask',
+        'full_mask', 'cell_owners', '_grid_json', 'special_cells',
+        'fully_fenced_count', 'claimed_count', '_player_idx', '_neighbors'
+    )
+    
+    # Orientation -> (opposite side, dx, dy) of the neighbouring cell that
+    # shares the fence; doubles as the set of valid orientations
+    _ORIENT = {
+        "north": ("south", 0, -1),
+        "east": ("west", 1, 0),
+        "south": ("north", 0, 1),
+        "west": ("east", -1, 0)
+    }
+    
     def __init__(self, grid_size=5, num_players=2):
         """Initialize a new game with the given grid size and player count"""
         self.game_id = str(uuid.uuid4())
         self.grid_size = grid_size
         self.num_players = num_players
         self.players = []
+        self._player_idx = {}  # Player id -> index in players
         self.current_player_index = 0
-        self.grid = self._initialize_grid(grid_size)
+        self._initialize_grid(grid_size)
         self.game_over = False
         self.winner = None
         self.created_at = datetime.now().isoformat()
         self.last_activity = time.time()
-        self.land_types = self._initialize_land_types(grid_size)
         self.turn_time_limit = 60  # 60 seconds per turn
         self.turn_start_time = time.time()
-        self.timer_thread = None
+        self._timer_entry = None
         self.timer_active = False
+        # Bumped by every mutator so encoded_state() can reuse the cached
+        # serialized snapshot between moves
+        self._state_version = 0
+        self._cached_version = -1
+        self._cached_encoded = None
     
     def _initialize_grid(self, size):
-        """Initialize an empty grid of the specified size"""
-        grid = []
-        for y in range(size):
-            row = []
-            for x in range(size):
-                cell = {
-                    "north": False,  # North fence
-                    "east": False,   # East fence
-                    "south": False,  # South fence
-                    "west": False,   # West fence
-                    "owner": None,   # Player who claimed this land
-                    "type": "regular"  # Type of land
-                }
-                row.append(cell)
-            grid.append(row)
-        return grid
-    
-    def _initialize_land_types(self, size):
-        """Initialize land types (all regular by default)"""
-        return "regular"
+        """Initialize empty fence bitboards and owner storage for the grid
+
+        The grid is stored structure-of-arrays: four integer bitboards hold
+        the fences, with bit y*size+x standing for cell (x, y), and flat
+        lists hold each cell's owner and land type. Enclosure and game-over
+        checks become a few bitwise operations on whole boards instead of
+        per-cell dict lookups.
+        """
+        self.north = 0
+        self.east = 0
+        self.south = 0
+        self.west = 0
+        self.owner_mask = 0  # Bit set where the cell has been claimed
+        self.full_mask = (1 << (size * size)) - 1
+        self.cell_owners = [None] * (size * size)
+        # Serializable mirror of the boards, patched in place by place_fence
+        # so to_dict never rebuilds the N x N dict grid. Treated as
+        # read-only by callers of to_dict.
+        self._grid_json = [
+            [{"north": False, "east": False, "south": False, "west": False,
+              "owner": None} for _ in range(size)]
+            for _ in range(size)
+        ]
+        # Per-cell neighbour info for each orientation: the shared-fence
+        # bit in the adjacent cell plus its coordinates, or None at an edge
+        self._neighbors = {}
+        for orientation, (opposite, dx, dy) in self._ORIENT.items():
+            table = []
+            for y in range(size):
+                for x in range(size):
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < size and 0 <= ny < size:
+                        table.append((1 << (ny * size + nx), ny, nx))
+                    else:
+                        table.append(None)
+            self._neighbors[orientation] = table
+        # Coordinates of bonus-scoring cells; empty until special land is
+        # actually generated, so regular cells carry no per-cell type data
+        self.special_cells = set()
+        # Maintained incrementally by place_fence so the game-over check
+        # never has to scan the boards
+        self.fully_fenced_count = 0
+        self.claimed_count = 0
     
     def add_player(self, player_id, player_name):
         """Add a player to the game"""
@@ -55,9 +153,10 @@ class Game:
             return False
         
         # Check if player is already in the game
-        if any(p["id"] == player_id for p in self.players):
+        if player_id in self._player_idx:
             return False
         
+        self._player_idx[player_id] = len(self.players)
         self.players.append({
             "id": player_id,
             "name": player_name,
@@ -65,6 +164,7 @@ class Game:
         })
         
         self.last_activity = time.time()
+        self._state_version += 1
         return True
     
     def place_fence(self, player_id, x, y, orientation):
@@ -82,42 +182,53 @@ class Game:
             return {"status": "error", "message": "Position out of bounds"}
         
         # Validate orientation
-        if orientation not in ["north", "east", "south", "west"]:
+        orient = self._ORIENT.get(orientation)
+        if orient is None:
             return {"status": "error", "message": "Invalid orientation"}
         
+        size = self.grid_size
+        idx = y * size + x
+        bit = 1 << idx
+        fenced_before = self.north & self.east & self.south & self.west
+        
         # Check if fence already exists
-        cell = self.grid[y][x]
-        if cell[orientation]:
+        if getattr(self, orientation) & bit:
             return {"status": "error", "message": "Fence already exists"}
         
-        # Place the fence
-        cell[orientation] = True
+        # Place the fence, flipping the adjacent cell's paired fence too,
+        # and patch the serializable grid mirror to match
+        setattr(self, orientation, getattr(self, orientation) | bit)
+        self._grid_json[y][x][orientation] = True
+        neighbor = self._neighbors[orientation][idx]
+        if neighbor is not None:
+            opposite = orient[0]
+            nbit, ny, nx = neighbor
+            setattr(self, opposite, getattr(self, opposite) | nbit)
+            self._grid_json[ny][nx][opposite] = True
         
-        # Also update the adjacent cell's corresponding fence
-        if orientation == "north" and y > 0:
-            self.grid[y-1][x]["south"] = True
-        elif orientation == "east" and x < self.grid_size - 1:
-            self.grid[y][x+1]["west"] = True
-        elif orientation == "south" and y < self.grid_size - 1:
-            self.grid[y+1][x]["north"] = True
-        elif orientation == "west" and x > 0:
-            self.grid[y][x-1]["east"] = True
+        # A placement can complete the placed cell and its neighbour at once
+        fenced_after = self.north & self.east & self.south & self.west
+        self.fully_fenced_count += (fenced_after & ~fenced_before).bit_count()
         
         # Check if land is claimed
         land_claimed = False
         if self._check_land_enclosed(x, y):
             # Update owner and score
             current_player = self.players[self.current_player_index]
-            cell["owner"] = current_player["id"]
+            self.cell_owners[idx] = current_player["id"]
+            self._grid_json[y][x]["owner"] = current_player["id"]
+            self.owner_mask |= bit
+            self.claimed_count += 1
             
             # Add points based on land type
-            points = 1 if cell["type"] == "regular" else 2
+            points = 2 if (x, y) in self.special_cells else 1
             current_player["score"] += points
             
             land_claimed = True
         
         # Update last activity
         self.last_activity = time.time()
+        self._state_version += 1
         
         # Update current player if no land was claimed
         if not land_claimed:
@@ -134,24 +245,14 @@ class Game:
     
     def _check_land_enclosed(self, x, y):
         """Check if a piece of land is completely enclosed by fences"""
-        cell = self.grid[y][x]
-        return (cell["north"] and cell["east"] and cell["south"] and 
-                cell["west"] and cell["owner"] is None)
+        bit = 1 << (y * self.grid_size + x)
+        return bool(self.north & self.east & self.south & self.west & bit and
+                    not self.owner_mask & bit)
     
     def _check_game_over(self):
-        """Check if the game is over (all land claimed)"""
-        for row in self.grid:
-            for cell in row:
-                # If all fences are present but no owner, it should have been claimed
-                if (cell["north"] and cell["east"] and cell["south"] and 
-                    cell["west"] and cell["owner"] is None):
-                    return False
-                
-                # If not all fences are present, game is not over
-                if not (cell["north"] and cell["east"] and cell["south"] and cell["west"]):
-                    return False
-        
-        return True
+        """Check if the game is over (all land fenced and claimed)"""
+        total = self.grid_size * self.grid_size
+        return self.fully_fenced_count == total and self.claimed_count == total
     
     def _end_game(self):
         """Handle game end conditions"""
@@ -171,7 +272,7 @@ class Game:
     def remove_player(self, player_id):
         """Handle a player leaving the game"""
         # Find player in the game
-        player_index = next((i for i, p in enumerate(self.players) if p["id"] == player_id), None)
+        player_index = self._player_idx.get(player_id)
         if player_index is None:
             return False
         
@@ -179,8 +280,12 @@ class Game:
         if len(self.players) <= 1:
             return "remove_game"
         
-        # Remove player from game
+        # Remove player from game and reindex the players that shifted down
         self.players.pop(player_index)
+        del self._player_idx[player_id]
+        for i in range(player_index, len(self.players)):
+            self._player_idx[self.players[i]["id"]] = i
+        self._state_version += 1
         
         # Adjust current player index if needed
         if self.current_player_index >= len(self.players):
@@ -190,6 +295,7 @@ class Game:
         if len(self.players) == 1:
             self.game_over = True
             self.winner = self.players[0]["id"]
+            self._state_version += 1
         
         return True
     
@@ -201,30 +307,66 @@ class Game:
             "num_players": self.num_players,
             "players": self.players,
             "current_player_index": self.current_player_index,
-            "grid": self.grid,
+            "grid": self._grid_json,
             "game_over": self.game_over,
             "winner": self.winner,
             "created_at": self.created_at,
             "last_activity": self.last_activity
         }
 
+    def encoded_state(self):
+        """Return the JSON-encoded game state, reusing it while unchanged
+
+        Between moves the state does not change, so broadcasts to several
+        players can all send the same bytes instead of re-serializing the
+        grid for each recipient.
+        """
+        if self._cached_version != self._state_version:
+            if orjson is not None:
+                self._cached_encoded = orjson.dumps(self.to_dict())
+            else:
+                self._cached_encoded = json.dumps(self.to_dict()).encode('utf-8')
+            self._cached_version = self._state_version
+        return self._cached_encoded
+    
+    def encode_binary(self):
+        """Pack the grid into one byte per cell for compact update frames
+
+        The low four bits carry the north/east/south/west fences and the
+        high four bits the owner's index in the players list (15 when
+        unclaimed), so a full grid costs N*N bytes instead of kilobytes of
+        JSON. Receivers index the bytes row-major, matching the bitboards.
+        """
+        size = self.grid_size
+        arr = bytearray(size * size)
+        north, east, south, west = self.north, self.east, self.south, self.west
+        player_idx = self._player_idx
+        cell_owners = self.cell_owners
+        for idx in range(size * size):
+            arr[idx] = (((north >> idx) & 1) |
+                        ((east >> idx) & 1) << 1 |
+                        ((south >> idx) & 1) << 2 |
+                        ((west >> idx) & 1) << 3 |
+                        player_idx.get(cell_owners[idx], 15) << 4)
+        return bytes(arr)
+    
     def start_turn_timer(self, on_timeout):
         """Start a timer for the current player's turn"""
         self.turn_start_time = time.time()
         self.timer_active = True
         
-        if self.timer_thread and self.timer_thread.is_alive():
-            self.timer_thread.cancel()
+        if self._timer_entry is not None:
+            self._timer_entry["cancelled"] = True
         
-        self.timer_thread = threading.Timer(self.turn_time_limit, on_timeout)
-        self.timer_thread.daemon = True
-        self.timer_thread.start()
+        self._timer_entry = _schedule_timer(
+            self.turn_start_time + self.turn_time_limit, on_timeout)
 
     def cancel_turn_timer(self):
         """Cancel the current turn timer"""
         self.timer_active = False
-        if self.timer_thread and self.timer_thread.is_alive():
-            self.timer_thread.cancel()
+        if self._timer_entry is not None:
+            self._timer_entry["cancelled"] = True
+            self._timer_entry = None
 
     def get_remaining_time(self):
         """Get the remaining time for the current turn"""
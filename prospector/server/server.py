@@ -2,100 +2,179 @@
 """
 Server implementation for Prospector game
 """
+import asyncio
+import hashlib
+import heapq
+import logging
+import hmac
+import os
 import socket
+import struct
 import json
-import threading
 import uuid
 import time
 import random
+import sqlite3
 from datetime import datetime
 
+# Each message on the wire is a 4-byte big-endian length followed by the
+# JSON payload, matching common.protocol
+HEADER_SIZE = 4
+
+# Per-message logging is at DEBUG so the hot path pays only a level check
+# by default; arguments are %-deferred and never formatted unless emitted
+logger = logging.getLogger("prospector.server")
+
+try:
+    # orjson parses and serializes the grid-heavy payloads several times
+    # faster than the stdlib codec and returns bytes directly
+    import orjson
+except ImportError:
+    orjson = None
+
+# scrypt cost parameters for stored passwords (n is the CPU/memory cost)
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SCRYPT_DKLEN = 32
+
+def hash_password(password, salt):
+    """Derive a scrypt hash for a password with the given salt"""
+    return hashlib.scrypt(password.encode('utf-8'), salt=salt,
+                          n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P,
+                          dklen=SCRYPT_DKLEN)
+
+# Fence bit masks in the packed per-cell byte; 0x0F means fully fenced
+FENCE_NORTH = 1
+FENCE_EAST = 2
+FENCE_SOUTH = 4
+FENCE_WEST = 8
+FENCE_ALL = 0x0F
+
+FENCE_BITS = {
+    "north": FENCE_NORTH,
+    "east": FENCE_EAST,
+    "south": FENCE_SOUTH,
+    "west": FENCE_WEST
+}
+
+# For each orientation, the offset of the neighbor sharing that edge and
+# the neighbor's side of it: (dx, dy, opposite side, opposite bit)
+NEIGHBOR = {
+    "north": (0, -1, "south", FENCE_SOUTH),
+    "east": (1, 0, "west", FENCE_WEST),
+    "south": (0, 1, "north", FENCE_NORTH),
+    "west": (-1, 0, "east", FENCE_EAST)
+}
+
 # Protocol functions
 def encode_message(message):
-    """Encode a message to JSON string"""
+    """Encode a message to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(message)
     return json.dumps(message).encode('utf-8')
 
 def decode_message(data):
-    """Decode a JSON string to a message dictionary"""
+    """Decode JSON bytes to a message dictionary"""
+    if orjson is not None:
+        return orjson.loads(data)
     return json.loads(data.decode('utf-8'))
 
 class GameServer:
     """Main server class for Prospector game"""
     
-    def __init__(self, host='127.0.0.1', port=5555):
+    def __init__(self, host='127.0.0.1', port=5555, db_path='prospector.db'):
         """Initialize the server"""
         self.host = host
         self.port = port
-        self.server_socket = None
         self.games = {}  # Dictionary to store active games
-        self.players = {}  # Dictionary to store player stats
-        self.recordings = {}  # Store game recordings
-        self.users = {}  # Store registered users
-        self.lock = threading.Lock()  # Lock for thread-safe operations
+        self.grids = {}  # Packed per-game grids (fences/owners/values) by game id
+        self.encoded_states = {}  # Serialized game dicts, cached between mutations
+        self.deadlines = []  # Min-heap of (turn deadline, game_id)
+        self.player_indexes = {}  # Per-game {player_id: seat index} maps
+        self.recordings_dir = "recordings"  # Per-game append-only move logs
+        self.recording_files = {}  # Open log handles by game id
+        self.db = self._open_db(db_path)  # Users and player stats
+        self.connections = {}  # Map player IDs to stream writers for broadcasts
         self.running = False
     
+    def _open_db(self, db_path):
+        """Open the stats database, creating the tables on first run
+
+        WAL mode lets readers proceed while a write commits and NORMAL
+        synchronous keeps commits off the fsync path; with autocommit every
+        statement is its own short transaction, so registered users and
+        player records survive restarts without any locking here.
+        """
+        db = sqlite3.connect(db_path, check_same_thread=False,
+                             isolation_level=None)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS users ("
+            "username TEXT PRIMARY KEY, salt BLOB, hash BLOB, "
+            "player_id TEXT, wins INT DEFAULT 0, losses INT DEFAULT 0, "
+            "draws INT DEFAULT 0)")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS players ("
+            "player_id TEXT PRIMARY KEY, name TEXT, "
+            "wins INT DEFAULT 0, losses INT DEFAULT 0, draws INT DEFAULT 0)")
+        return db
+    
     def start(self):
-        """Start the server"""
-        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        
-        try:
-            self.server_socket.bind((self.host, self.port))
-            self.server_socket.listen(5)
-            self.running = True
-            print(f"Server started on {self.host}:{self.port}")
-            
-            # Start inactivity checker
-            checker_thread = threading.Thread(target=self.check_inactivity)
-            checker_thread.daemon = True
-            checker_thread.start()
-            
-            while self.running:
-                try:
-                    client_socket, address = self.server_socket.accept()
-                    print(f"Connection from {address}")
-                    
-                    # Create a new thread to handle the client
-                    client_thread = threading.Thread(
-                        target=self.handle_client,
-                        args=(client_socket, address)
-                    )
-                    client_thread.daemon = True
-                    client_thread.start()
-                    
-                except Exception as e:
-                    if self.running:
-                        print(f"Error accepting connection: {e}")
-            
-        except Exception as e:
-            print(f"Server error: {e}")
-        finally:
-            self.stop()
+        """Start the server on an asyncio event loop"""
+        asyncio.run(self._serve())
     
     def stop(self):
         """Stop the server"""
         self.running = False
-        if self.server_socket:
-            self.server_socket.close()
-            print("Server stopped")
+        logger.info("Server stopped")
+    
+    async def _serve(self):
+        """Accept connections and serve every client on one event loop
+
+        SO_REUSEPORT lets additional server processes bind the same port so
+        the kernel load-balances new connections across them (games are
+        kept in process memory, so spreading one deployment over several
+        workers also needs the game state partitioned by port or moved to
+        shared storage). The deep backlog absorbs connection bursts.
+        """
+        server = await asyncio.start_server(
+            self._handle_client, self.host, self.port,
+            reuse_port=hasattr(socket, 'SO_REUSEPORT'), backlog=1024)
+        self.running = True
+        logger.info("Server started on %s:%s", self.host, self.port)
+        
+        # Start inactivity checker
+        asyncio.create_task(self.check_inactivity())
+        
+        async with server:
+            await server.serve_forever()
     
-    def handle_client(self, client_socket, address):
+    async def _handle_client(self, reader, writer):
         """Handle a client connection"""
+        address = writer.get_extra_info('peername')
+        logger.debug("Connection from %s", address)
         player_id = str(uuid.uuid4())
         player_name = None
         game_id = None
+        self.connections[player_id] = writer
         
         try:
             while self.running:
-                # Receive data from client
-                data = client_socket.recv(4096)
-                if not data:
+                # Receive one length-prefixed frame; a bare recv can split
+                # or coalesce messages since TCP has no boundaries
+                try:
+                    header = await reader.readexactly(HEADER_SIZE)
+                    (length,) = struct.unpack('>I', header)
+                    data = await reader.readexactly(length)
+                except asyncio.IncompleteReadError:
                     break
                 
                 # Parse JSON message
                 try:
                     message = decode_message(data)
-                    print(f"Received from {address}: {message}")
+                    logger.debug("Received from %s: %s", address, message)
                     
                     # Process message
                     response = self.process_message(message, player_id)
@@ -107,27 +186,125 @@ class GameServer:
                         game_id = response['game_id']
                     
                     # Send response
-                    client_socket.send(encode_message(response))
-                except json.JSONDecodeError:
-                    print(f"Invalid JSON from {address}")
-                    client_socket.send(encode_message({
+                    await self._send_response(writer, response)
+                except ValueError:  # Covers orjson and stdlib decode errors
+                    logger.warning("Invalid JSON from %s", address)
+                    self._write_frame(writer, {
                         "status": "error",
                         "message": "Invalid JSON format"
-                    }))
+                    })
+                    await writer.drain()
                 
         except Exception as e:
-            print(f"Error handling client {address}: {e}")
+            logger.error("Error handling client %s: %s", address, e)
         finally:
             # Clean up when client disconnects
-            print(f"Client {address} disconnected")
+            logger.debug("Client %s disconnected", address)
+            self.connections.pop(player_id, None)
             if game_id and game_id in self.games:
                 self.handle_player_disconnect(player_id, game_id)
-            client_socket.close()
+            writer.close()
+    
+    def _game_json(self, game):
+        """Serialized bytes for a game dict, cached until the next mutation
+
+        The same snapshot is often sent to every player in a game; encoding
+        it once and reusing the bytes keeps dumps cost proportional to how
+        often the state changes, not how many clients read it.
+        """
+        cached = self.encoded_states.get(game["game_id"])
+        if cached is None:
+            cached = encode_message(game)
+            self.encoded_states[game["game_id"]] = cached
+        return cached
+    
+    def _encode_response(self, response):
+        """Encode a response, splicing in cached game-state bytes
+
+        Responses embedding a live game dict are assembled by hand around
+        the cached serialization so the big nested grid is never re-encoded
+        per recipient.
+        """
+        game = response.get("game_state")
+        if not (isinstance(game, dict) and game.get("game_id") in self.games):
+            return encode_message(response)
+        rest = {k: v for k, v in response.items() if k != "game_state"}
+        head = encode_message(rest)
+        return b''.join((head[:-1], b',"game_state":', self._game_json(game), b'}'))
+    
+    def _write_frame(self, writer, message):
+        """Queue one length-prefixed message on a stream writer"""
+        payload = self._encode_response(message)
+        writer.writelines([struct.pack('>I', len(payload)), payload])
+    
+    async def _send_response(self, writer, response):
+        """Encode a response and queue it, dumping big payloads off-loop
+
+        Large uncached snapshots (8x8 grids and up) and long recordings are
+        encoded in the default executor. The encoder holds the GIL for the
+        whole call, so nothing runs concurrently with the dump itself; the
+        hop only keeps the loop runnable before and after the encode
+        instead of parking it inside the call. Small responses are encoded
+        inline; a thread-pool hop costs more than their dump. Because other
+        handlers can run across the await, bytes from the executor are
+        published to the cache only if the game is still unchanged when the
+        encode finishes.
+        """
+        payload = None
+        game = response.get("game_state")
+        if isinstance(game, dict) and game.get("game_id") in self.games:
+            game_id = game["game_id"]
+            if (self.encoded_states.get(game_id) is None
+                    and game.get("total_cells", 0) >= 64):
+                # Everything a mutator touches that version alone misses:
+                # joins and disconnects change the seat count, timeout
+                # skips only bump last_activity
+                token = (game.get("version"), game.get("last_activity"),
+                         len(game["players"]), game.get("game_over"))
+                loop = asyncio.get_running_loop()
+                encoded = await loop.run_in_executor(None, encode_message, game)
+                # A mutation handled during the await has invalidated the
+                # cache (and may have re-filled it with fresher bytes);
+                # installing these would serve a snapshot behind the
+                # delta stream
+                if (self.encoded_states.get(game_id) is None
+                        and token == (game.get("version"),
+                                      game.get("last_activity"),
+                                      len(game["players"]),
+                                      game.get("game_over"))):
+                    self.encoded_states[game_id] = encoded
+        elif len(response.get("recording", ())) > 64:
+            loop = asyncio.get_running_loop()
+            payload = await loop.run_in_executor(None, encode_message, response)
+        if payload is None:
+            payload = self._encode_response(response)
+        writer.writelines([struct.pack('>I', len(payload)), payload])
+        await writer.drain()
+    
+    def broadcast_to_game(self, game, message, exclude=None):
+        """Push a message to every connected player in a game
+
+        The payload is encoded once and shared by all recipients; the 4-byte
+        length header and the body are queued on each writer in one vectored
+        writelines call and flushed by the event loop.
+        """
+        payload = self._encode_response(message)
+        header = struct.pack('>I', len(payload))
+        for player in game["players"]:
+            if player["id"] == exclude:
+                continue
+            conn = self.connections.get(player["id"])
+            if conn is None:
+                continue
+            try:
+                conn.writelines([header, payload])
+            except OSError as e:
+                logger.warning("Broadcast error to %s: %s", player['name'], e)
     
     def process_message(self, message, player_id):
         """Process a message from a client"""
         action = message.get('action', '')
-        print(f"Processing action: {action}")
+        logger.debug("Processing action: %s", action)
         
         if action == 'create_game':
             return self.create_game(message, player_id)
@@ -149,309 +326,388 @@ class GameServer:
             return self.get_game_recording(message, player_id)
         elif action == 'logout_user':
             return self.logout_user(message, player_id)
+        elif action == 'get_game_state':
+            return self.get_game_state(message, player_id)
         else:
             return {"status": "error", "message": "Unknown action"}
     
     def create_game(self, message, player_id):
         """Create a new game"""
-        with self.lock:
-            player_name = message.get('player_name', f"Player_{player_id[:8]}")
-            grid_size = message.get('grid_size', 5)
-            num_players = message.get('num_players', 2)
-            
-            # Validate inputs
-            if grid_size < 2 or grid_size > 10:
-                return {"status": "error", "message": "Invalid grid size (2-10)"}
-            if num_players < 2 or num_players > 4:
-                return {"status": "error", "message": "Invalid number of players (2-4)"}
-            
-            # Create game ID
-            game_id = str(uuid.uuid4())
-            
-            # Initialize game state
-            game_state = {
-                "game_id": game_id,
-                "grid_size": grid_size,
-                "num_players": num_players,
-                "players": [{
-                    "id": player_id,
-                    "name": player_name,
-                    "score": 0
-                }],
-                "current_player_index": 0,
-                "grid": self.initialize_grid(grid_size),
-                "game_over": False,
-                "winner": None,
-                "created_at": datetime.now().isoformat(),
-                "last_activity": time.time(),
-                "turn_start_time": time.time(),
-                "turn_time_limit": 60  # 60 seconds per turn
-            }
-            
-            # Store game state
-            self.games[game_id] = game_state
-            
-            # Initialize player stats
-            if player_id not in self.players:
-                self.players[player_id] = {
-                    "name": player_name,
-                    "wins": 0,
-                    "losses": 0,
-                    "draws": 0
-                }
+        player_name = message.get('player_name', f"Player_{player_id[:8]}")
+        grid_size = message.get('grid_size', 5)
+        num_players = message.get('num_players', 2)
+            
+        # Validate inputs
+        if grid_size < 2 or grid_size > 10:
+            return {"status": "error", "message": "Invalid grid size (2-10)"}
+        if num_players < 2 or num_players > 4:
+            return {"status": "error", "message": "Invalid number of players (2-4)"}
+            
+        # Create game ID
+        game_id = str(uuid.uuid4())
+        
+        grid, packed = self.initialize_grid(grid_size)
+            
+        # Initialize game state
+        game_state = {
+            "game_id": game_id,
+            "grid_size": grid_size,
+            "num_players": num_players,
+            "players": [{
+                "id": player_id,
+                "name": player_name,
+                "score": 0
+            }],
+            "current_player_index": 0,
+            "grid": grid,
+            "game_over": False,
+            "winner": None,
+            "created_at": datetime.now().isoformat(),
+            "last_activity": time.time(),
+            "turn_start_time": time.time(),
+            "turn_time_limit": 60,  # 60 seconds per turn
+            "version": 0,  # Bumped per move so clients can order deltas
+            "filled_cells": 0,  # Cells whose four fences are all placed
+            "total_cells": grid_size * grid_size
+        }
             
-            # Initialize recordings for this game
-            self.recordings[game_id] = []
+        # Store game state
+        self.games[game_id] = game_state
+        self.grids[game_id] = packed
+        self.player_indexes[game_id] = {player_id: 0}
             
-            return {
-                "status": "success",
-                "message": "Game created successfully",
-                "game_id": game_id,
-                "game_state": game_state
-            }
+        # Initialize player stats
+        self.db.execute(
+            "INSERT OR IGNORE INTO players VALUES (?, ?, 0, 0, 0)",
+            (player_id, player_name))
+            
+        # Open the append-only move log for this game
+        self._open_recording(game_id)
+            
+        # Schedule the first turn deadline
+        heapq.heappush(self.deadlines,
+                       (game_state["turn_start_time"] + game_state["turn_time_limit"], game_id))
+            
+        return {
+            "status": "success",
+            "message": "Game created successfully",
+            "game_id": game_id,
+            "game_state": game_state
+        }
     
     def join_game(self, message, player_id):
         """Join an existing game"""
-        with self.lock:
-            game_id = message.get('game_id')
-            player_name = message.get('player_name', f"Player_{player_id[:8]}")
+        game_id = message.get('game_id')
+        player_name = message.get('player_name', f"Player_{player_id[:8]}")
             
-            if not game_id or game_id not in self.games:
-                return {"status": "error", "message": "Invalid game ID"}
+        if not game_id or game_id not in self.games:
+            return {"status": "error", "message": "Invalid game ID"}
             
-            game = self.games[game_id]
+        game = self.games[game_id]
             
-            # Check if game is full
-            if len(game["players"]) >= game.get("num_players", 2):
-                return {"status": "error", "message": "Game is full"}
+        # Check if game is full
+        if len(game["players"]) >= game.get("num_players", 2):
+            return {"status": "error", "message": "Game is full"}
             
-            # Check if player is already in the game
-            if any(p["id"] == player_id for p in game["players"]):
-                return {"status": "error", "message": "Player already in game"}
+        # Check if player is already in the game
+        if player_id in self.player_indexes[game_id]:
+            return {"status": "error", "message": "Player already in game"}
             
-            # Add player to game
-            game["players"].append({
-                "id": player_id,
-                "name": player_name,
-                "score": 0
-            })
+        # Add player to game
+        game["players"].append({
+            "id": player_id,
+            "name": player_name,
+            "score": 0
+        })
+        self.player_indexes[game_id][player_id] = len(game["players"]) - 1
             
-            # Update last activity
-            game["last_activity"] = time.time()
+        # Update last activity
+        game["last_activity"] = time.time()
+        self.encoded_states.pop(game_id, None)
             
-            # Initialize player stats
-            if player_id not in self.players:
-                self.players[player_id] = {
-                    "name": player_name,
-                    "wins": 0,
-                    "losses": 0,
-                    "draws": 0
-                }
+        # Initialize player stats
+        self.db.execute(
+            "INSERT OR IGNORE INTO players VALUES (?, ?, 0, 0, 0)",
+            (player_id, player_name))
             
-            return {
-                "status": "success",
-                "message": "Game joined successfully",
-                "game_id": game_id,
-                "game_state": game
-            }
+        # Notify the players already in the game
+        self.broadcast_to_game(game, {
+            "status": "success",
+            "message": f"{player_name} joined the game",
+            "game_state": game
+        }, exclude=player_id)
+            
+        return {
+            "status": "success",
+            "message": "Game joined successfully",
+            "game_id": game_id,
+            "game_state": game
+        }
 
     def place_fence(self, message, player_id):
         """Place a fence"""
-        with self.lock:
-            game_id = message.get('game_id')
-            position = message.get('position', {})
-            orientation = message.get('orientation')
-            
-            if not game_id or game_id not in self.games:
-                return {"status": "error", "message": "Invalid game ID"}
-            
-            game = self.games[game_id]
-            
-            # Check if it's the player's turn
-            current_player = game["players"][game["current_player_index"]]
-            if current_player["id"] != player_id:
-                return {"status": "error", "message": "Not your turn"}
-            
-            # Check if the game is over
-            if game["game_over"]:
-                return {"status": "error", "message": "Game is over"}
-            
-            # Validate and place the fence
-            x = position.get('x')
-            y = position.get('y')
-            
-            # Validate position
-            if x is None or y is None:
-                return {"status": "error", "message": "Invalid position"}
-            
-            if x < 0 or x >= game["grid_size"] or y < 0 or y >= game["grid_size"]:
-                return {"status": "error", "message": "Position out of bounds"}
-            
-            # Validate orientation
-            if orientation not in ["north", "east", "south", "west"]:
-                return {"status": "error", "message": "Invalid orientation"}
-            
-            # Check if fence already exists
-            grid = game["grid"]
-            cell = grid[y][x]
-            if cell[orientation]:
-                return {"status": "error", "message": "Fence already exists"}
-            
-            # Place the fence
-            cell[orientation] = True
-            
-            # Update adjacent cell's fence
-            if orientation == "north" and y > 0:
-                grid[y-1][x]["south"] = True
-            elif orientation == "east" and x < game["grid_size"] - 1:
-                grid[y][x+1]["west"] = True
-            elif orientation == "south" and y < game["grid_size"] - 1:
-                grid[y+1][x]["north"] = True
-            elif orientation == "west" and x > 0:
-                grid[y][x-1]["east"] = True
-            
-            # Check if land is claimed
-            land_claimed = False
-            if self.check_land_enclosed(grid, x, y):
-                # Update owner and score
-                cell["owner"] = current_player["id"]
-                # Add score based on land type
-                land_value = cell.get("value", 1)  # Default to 1 if no value specified
-                current_player["score"] += land_value
-                land_claimed = True
-            
-            # Update last activity
-            game["last_activity"] = time.time()
-            
-            # Update current player if no land was claimed
-            if not land_claimed:
-                game["current_player_index"] = (game["current_player_index"] + 1) % len(game["players"])
-            
-            # Reset turn timer
-            game["turn_start_time"] = time.time()
-            
-            # Record the move
-            if game_id not in self.recordings:
-                self.recordings[game_id] = []
-
-            self.recordings[game_id].append({
-                "timestamp": time.time(),
-                "player_id": player_id,
-                "player_name": current_player["name"],
-                "position": {"x": x, "y": y},
-                "orientation": orientation,
-                "land_claimed": land_claimed
-            })
+        game_id = message.get('game_id')
+        position = message.get('position', {})
+        orientation = message.get('orientation')
             
-            # Check if the game is over
-            if self.check_game_over(game):
-                self.end_game(game)
+        if not game_id or game_id not in self.games:
+            return {"status": "error", "message": "Invalid game ID"}
             
-            return {
-                "status": "success",
-                "message": "Fence placed successfully",
-                "game_state": game,
-                "land_claimed": land_claimed
-            }
-    
-    def leave_game(self, message, player_id):
-        """Leave a game"""
-        with self.lock:
-            game_id = message.get('game_id')
+        game = self.games[game_id]
             
-            if not game_id or game_id not in self.games:
-                return {"status": "error", "message": "Invalid game ID"}
+        # Check if it's the player's turn
+        current_player = game["players"][game["current_player_index"]]
+        if current_player["id"] != player_id:
+            return {"status": "error", "message": "Not your turn"}
             
-            game = self.games[game_id]
+        # Check if the game is over
+        if game["game_over"]:
+            return {"status": "error", "message": "Game is over"}
             
-            return self.handle_player_disconnect(player_id, game_id)
-    
-    def get_stats(self, message, player_id):
-        """Get player statistics"""
-        with self.lock:
-            if player_id not in self.players:
-                return {"status": "error", "message": "Player not found"}
-            
-            return {
-                "status": "success",
-                "message": "Player statistics",
-                "stats": self.players[player_id]
-            }
-    
-    def handle_player_disconnect(self, player_id, game_id):
-        """Handle a player disconnecting"""
-        with self.lock:
-            if game_id not in self.games:
-                return {"status": "error", "message": "Game not found"}
+        # Validate and place the fence
+        x = position.get('x')
+        y = position.get('y')
             
-            game = self.games[game_id]
+        # Validate position
+        if x is None or y is None:
+            return {"status": "error", "message": "Invalid position"}
             
-            # Find player in the game
-            player_index = None
-            for i, player in enumerate(game["players"]):
-                if player["id"] == player_id:
-                    player_index = i
-                    break
+        if x < 0 or x >= game["grid_size"] or y < 0 or y >= game["grid_size"]:
+            return {"status": "error", "message": "Position out of bounds"}
             
-            if player_index is None:
-                return {"status": "error", "message": "Player not in game"}
+        # Validate orientation
+        if orientation not in NEIGHBOR:
+            return {"status": "error", "message": "Invalid orientation"}
+            
+        # Check if fence already exists
+        size = game["grid_size"]
+        grid = game["grid"]
+        packed = self.grids[game_id]
+        fences = packed["fences"]
+        idx = y * size + x
+        if fences[idx] & FENCE_BITS[orientation]:
+            return {"status": "error", "message": "Fence already exists"}
+            
+        # Place the fence in the packed grid and the serializable mirror,
+        # counting the cell as filled if this was its fourth fence
+        fences[idx] |= FENCE_BITS[orientation]
+        if fences[idx] == FENCE_ALL:
+            game["filled_cells"] += 1
+        grid[y][x][orientation] = True
+            
+        # The cell updates that this move will carry in its delta
+        changed_cells = [{"x": x, "y": y, orientation: True}]
+            
+        # Update the adjacent cell's matching fence via the edge table;
+        # one bounds check replaces the per-orientation branch chain
+        dx, dy, opposite, opposite_bit = NEIGHBOR[orientation]
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < size and 0 <= ny < size:
+            nidx = ny * size + nx
+            fences[nidx] |= opposite_bit
+            if fences[nidx] == FENCE_ALL:
+                game["filled_cells"] += 1
+            grid[ny][nx][opposite] = True
+            changed_cells.append({"x": nx, "y": ny, opposite: True})
+            
+        # Check if land is claimed; the enclosure test is the packed-cell
+        # equality inlined at its only callsite
+        land_claimed = False
+        owners = packed["owners"]
+        if fences[idx] == FENCE_ALL and owners[idx] is None:
+            # Update owner and score
+            owners[idx] = current_player["id"]
+            grid[y][x]["owner"] = current_player["id"]
+            # Add score based on land value
+            current_player["score"] += packed["values"][idx]
+            changed_cells[0]["owner"] = current_player["id"]
+            land_claimed = True
+            
+        # Update last activity
+        game["last_activity"] = time.time()
+            
+        # Update current player if no land was claimed
+        if not land_claimed:
+            game["current_player_index"] = (game["current_player_index"] + 1) % len(game["players"])
+            
+        # Reset turn timer and schedule the new turn's deadline
+        game["turn_start_time"] = time.time()
+        heapq.heappush(self.deadlines,
+                       (game["turn_start_time"] + game["turn_time_limit"], game_id))
+            
+        # Record the move in the append-only per-game log; moves are not
+        # kept resident, so long games cost no server memory
+        recording_file = self.recording_files.get(game_id)
+        if recording_file is None:
+            recording_file = self._open_recording(game_id)
+        recording_file.write(encode_message({
+            "timestamp": time.time(),
+            "player_id": player_id,
+            "player_name": current_player["name"],
+            "position": {"x": x, "y": y},
+            "orientation": orientation,
+            "land_claimed": land_claimed
+        }) + b"\n")
+            
+        # Check if the game is over
+        if self.check_game_over(game):
+            self.end_game(game)
+            
+        # A move touches at most two cells, so responses and broadcasts
+        # carry just those plus score/turn updates instead of the whole
+        # grid; clients resync with get_game_state if they miss a version
+        game["version"] += 1
+        self.encoded_states.pop(game_id, None)
+        delta = {
+            "version": game["version"],
+            "changed_cells": changed_cells,
+            "current_player_index": game["current_player_index"]
+        }
+        if land_claimed:
+            delta["score_updates"] = {player_id: current_player["score"]}
+        if game["game_over"]:
+            delta["game_over"] = True
+            delta["winner"] = game["winner"]
+            
+        # Notify the other players of the update
+        self.broadcast_to_game(game, {
+            "status": "success",
+            "message": "Game updated",
+            "delta": delta
+        }, exclude=player_id)
             
-            # If game hasn't started or only one player, remove the game
-            if len(game["players"]) <= 1:
-                del self.games[game_id]
-                return {"status": "success", "message": "Game removed"}
+        return {
+            "status": "success",
+            "message": "Fence placed successfully",
+            "delta": delta,
+            "land_claimed": land_claimed
+        }
+    
+    def get_game_state(self, message, player_id):
+        """Return a full game-state snapshot (delta resync)"""
+        game_id = message.get('game_id')
             
-            # Otherwise, handle as player leaving
-            player = game["players"][player_index]
+        if not game_id or game_id not in self.games:
+            return {"status": "error", "message": "Invalid game ID"}
             
-            # Update remaining players' stats (they win)
-            for p in game["players"]:
-                if p["id"] != player_id:
-                    if p["id"] in self.players:
-                        self.players[p["id"]]["wins"] += 1
+        return {
+            "status": "success",
+            "message": "Game state",
+            "game_state": self.games[game_id]
+        }
+    
+    def leave_game(self, message, player_id):
+        """Leave a game"""
+        game_id = message.get('game_id')
             
-            # Update leaving player's stats (they lose)
-            if player_id in self.players:
-                self.players[player_id]["losses"] += 1
+        if not game_id or game_id not in self.games:
+            return {"status": "error", "message": "Invalid game ID"}
             
-            # Remove player from game
-            game["players"].pop(player_index)
+        game = self.games[game_id]
             
-            # Adjust current player index if needed
-            if game["current_player_index"] >= len(game["players"]):
-                game["current_player_index"] = 0
+        return self.handle_player_disconnect(player_id, game_id)
+    
+    def get_stats(self, message, player_id):
+        """Get player statistics"""
+        row = self.db.execute(
+            "SELECT name, wins, losses, draws FROM players WHERE player_id = ?",
+            (player_id,)).fetchone()
+        if row is None:
+            return {"status": "error", "message": "Player not found"}
             
-            # Mark game as over if only one player remains
-            if len(game["players"]) == 1:
-                game["game_over"] = True
-                game["winner"] = game["players"][0]["id"]
+        return {
+            "status": "success",
+            "message": "Player statistics",
+            "stats": {"name": row[0], "wins": row[1],
+                      "losses": row[2], "draws": row[3]}
+        }
+    
+    def handle_player_disconnect(self, player_id, game_id):
+        """Handle a player disconnecting"""
+        if game_id not in self.games:
+            return {"status": "error", "message": "Game not found"}
+            
+        game = self.games[game_id]
+            
+        # Find player in the game
+        player_index = self.player_indexes.get(game_id, {}).get(player_id)
+            
+        if player_index is None:
+            return {"status": "error", "message": "Player not in game"}
+            
+        # If game hasn't started or only one player, remove the game; the
+        # recording log stays on disk
+        if len(game["players"]) <= 1:
+            del self.games[game_id]
+            self.grids.pop(game_id, None)
+            self.encoded_states.pop(game_id, None)
+            self.player_indexes.pop(game_id, None)
+            recording_file = self.recording_files.pop(game_id, None)
+            if recording_file is not None:
+                recording_file.close()
+            return {"status": "success", "message": "Game removed"}
+            
+        # Otherwise, handle as player leaving
+        player = game["players"][player_index]
+            
+        # Update remaining players' stats (they win)
+        self.db.executemany(
+            "UPDATE players SET wins = wins + 1 WHERE player_id = ?",
+            [(p["id"],) for p in game["players"] if p["id"] != player_id])
+            
+        # Update leaving player's stats (they lose)
+        self.db.execute(
+            "UPDATE players SET losses = losses + 1 WHERE player_id = ?",
+            (player_id,))
+            
+        # Remove player from game and reindex the seats behind them
+        game["players"].pop(player_index)
+        self.player_indexes[game_id] = {
+            p["id"]: i for i, p in enumerate(game["players"])}
+            
+        # Adjust current player index if needed
+        if game["current_player_index"] >= len(game["players"]):
+            game["current_player_index"] = 0
+            
+        # Mark game as over if only one player remains
+        if len(game["players"]) == 1:
+            game["game_over"] = True
+            game["winner"] = game["players"][0]["id"]
+            
+        self.encoded_states.pop(game_id, None)
             
-            return {
-                "status": "success",
-                "message": "Player left game",
-                "game_state": game
-            }
+        return {
+            "status": "success",
+            "message": "Player left game",
+            "game_state": game
+        }
     
     def initialize_grid(self, size):
-        """Initialize an empty grid with different land types"""
+        """Initialize an empty grid with different land types
+
+        Returns the serializable dict grid for the wire format plus a packed
+        structure-of-arrays copy — one fence byte, one owner slot and one
+        value byte per cell, row-major. The hot checks read the packed
+        arrays; place_fence patches both so they never diverge.
+        """
         grid = []
+        fences = bytearray(size * size)
+        owners = [None] * (size * size)
+        values = bytearray(size * size)
+        # Draw every cell's land type in one batched call
+        land_types = random.choices(
+            ["regular", "copper", "gold"],
+            weights=[0.7, 0.2, 0.1],  # 70% regular, 20% copper, 10% gold
+            k=size * size
+        )
+        value_map = {"regular": 1, "copper": 2, "gold": 3}
         for y in range(size):
             row = []
             for x in range(size):
-                # Randomly determine land type
-                land_type = random.choices(
-                    ["regular", "copper", "gold"],
-                    weights=[0.7, 0.2, 0.1],  # 70% regular, 20% copper, 10% gold
-                    k=1
-                )[0]
-                
-                # Assign value based on land type
-                land_value = 1
-                if land_type == "copper":
-                    land_value = 2
-                elif land_type == "gold":
-                    land_value = 3
+                land_type = land_types[y * size + x]
+                land_value = value_map[land_type]
                 
+                values[y * size + x] = land_value
                 cell = {
                     "north": False,
                     "east": False,
@@ -463,22 +719,11 @@ class GameServer:
                 }
                 row.append(cell)
             grid.append(row)
-        return grid
-    
-    def check_land_enclosed(self, grid, x, y):
-        """Check if a piece of land is completely enclosed by fences"""
-        cell = grid[y][x]
-        return (cell["north"] and cell["east"] and cell["south"] and 
-                cell["west"] and cell["owner"] is None)
+        return grid, {"fences": fences, "owners": owners, "values": values}
     
     def check_game_over(self, game):
         """Check if the game is over (all land claimed)"""
-        grid = game["grid"]
-        for row in grid:
-            for cell in row:
-                if not (cell["north"] and cell["east"] and cell["south"] and cell["west"]):
-                    return False
-        return True
+        return game["filled_cells"] >= game["total_cells"]
     
     def end_game(self, game):
         """Handle game end conditions"""
@@ -494,49 +739,63 @@ class GameServer:
             game["winner"] = winner_id
             
             # Update player stats
-            for player in game["players"]:
-                player_id = player["id"]
-                if player_id in self.players:
-                    if player_id == winner_id:
-                        self.players[player_id]["wins"] += 1
-                    else:
-                        self.players[player_id]["losses"] += 1
+            self.db.execute(
+                "UPDATE players SET wins = wins + 1 WHERE player_id = ?",
+                (winner_id,))
+            self.db.executemany(
+                "UPDATE players SET losses = losses + 1 WHERE player_id = ?",
+                [(p["id"],) for p in game["players"] if p["id"] != winner_id])
         else:
             # It's a draw
             game["winner"] = "draw"
             
             # Update player stats
-            for player in game["players"]:
-                player_id = player["id"]
-                if player_id in self.players:
-                    self.players[player_id]["draws"] += 1
+            self.db.executemany(
+                "UPDATE players SET draws = draws + 1 WHERE player_id = ?",
+                [(p["id"],) for p in game["players"]])
     
-    def check_inactivity(self):
-        """Periodically check for inactive players"""
-        inactivity_timeout = 60  # 60 seconds
-        
+    async def check_inactivity(self):
+        """Skip the turn of any player whose deadline passes
+
+        Turn deadlines sit in a min-heap, pushed whenever a turn starts, so
+        the checker sleeps until the earliest one is due instead of scanning
+        every game on a fixed tick. A move resets turn_start_time and pushes
+        a fresh entry, which makes the old one stale; stale entries are
+        discarded when they surface. New entries are always at least a full
+        turn away, so sleeping to the current minimum never oversleeps one.
+        """
         while self.running:
-            time.sleep(10)  # Check every 10 seconds
-            
             current_time = time.time()
             
-            with self.lock:
-                for game_id, game in list(self.games.items()):
-                    if game["game_over"]:
-                        continue
+            if not self.deadlines:
+                await asyncio.sleep(10)
+                continue
+            
+            deadline, game_id = self.deadlines[0]
+            if deadline > current_time:
+                await asyncio.sleep(deadline - current_time)
+                continue
+            heapq.heappop(self.deadlines)
+            
+            game = self.games.get(game_id)
+            if game is None or game["game_over"]:
+                continue
+            
+            # Check if current player has been inactive
+            turn_start_time = game.get("turn_start_time", current_time)
+            if current_time - turn_start_time > game["turn_time_limit"]:
+                current_player_index = game["current_player_index"]
+                current_player = game["players"][current_player_index]
+                    
+                logger.info("Player %s timed out in game %s", current_player['name'], game_id)
                     
-                    # Check if current player has been inactive
-                    turn_start_time = game.get("turn_start_time", current_time)
-                    if current_time - turn_start_time > inactivity_timeout:
-                        current_player_index = game["current_player_index"]
-                        current_player = game["players"][current_player_index]
-                        
-                        print(f"Player {current_player['name']} timed out in game {game_id}")
-                        
-                        # Move to next player
-                        game["current_player_index"] = (current_player_index + 1) % len(game["players"])
-                        game["turn_start_time"] = current_time
-                        game["last_activity"] = current_time
+                # Move to next player and schedule their deadline
+                game["current_player_index"] = (current_player_index + 1) % len(game["players"])
+                game["turn_start_time"] = current_time
+                game["last_activity"] = current_time
+                self.encoded_states.pop(game_id, None)
+                heapq.heappush(self.deadlines,
+                               (current_time + game["turn_time_limit"], game_id))
     
     def register_user(self, message, player_id):
         """Register a new user"""
@@ -546,26 +805,22 @@ class GameServer:
         if not username or not password:
             return {"status": "error", "message": "Username and password required"}
         
-        with self.lock:
-            if username in self.users:
-                return {"status": "error", "message": "Username already exists"}
-            
-            # Create user
-            self.users[username] = {
-                "password": password,
-                "player_id": player_id,
-                "stats": {
-                    "wins": 0,
-                    "losses": 0,
-                    "draws": 0
-                }
-            }
+        # Store a salted scrypt hash, never the password itself; the
+        # primary key rejects duplicate usernames
+        salt = os.urandom(16)
+        try:
+            self.db.execute(
+                "INSERT INTO users (username, salt, hash, player_id) "
+                "VALUES (?, ?, ?, ?)",
+                (username, salt, hash_password(password, salt), player_id))
+        except sqlite3.IntegrityError:
+            return {"status": "error", "message": "Username already exists"}
             
-            return {
-                "status": "success",
-                "message": f"User {username} registered successfully",
-                "username": username
-            }
+        return {
+            "status": "success",
+            "message": f"User {username} registered successfully",
+            "username": username
+        }
 
     def login_user(self, message, player_id):
         """Login an existing user"""
@@ -575,35 +830,38 @@ class GameServer:
         if not username or not password:
             return {"status": "error", "message": "Username and password required"}
         
-        with self.lock:
-            if username not in self.users:
-                return {"status": "error", "message": "Username not found"}
-            
-            if self.users[username]["password"] != password:
-                return {"status": "error", "message": "Incorrect password"}
-            
-            # Update player ID
-            old_player_id = self.users[username]["player_id"]
-            self.users[username]["player_id"] = player_id
-            
-            # Copy stats from old player ID if it exists
-            if old_player_id in self.players:
-                self.players[player_id] = self.players[old_player_id]
-                self.players[player_id]["name"] = username
-            else:
-                # Initialize player stats
-                self.players[player_id] = {
-                    "name": username,
-                    "wins": self.users[username]["stats"]["wins"],
-                    "losses": self.users[username]["stats"]["losses"],
-                    "draws": self.users[username]["stats"]["draws"]
-                }
+        row = self.db.execute(
+            "SELECT salt, hash, player_id, wins, losses, draws "
+            "FROM users WHERE username = ?", (username,)).fetchone()
+        if row is None:
+            return {"status": "error", "message": "Username not found"}
+            
+        salt, stored_hash, old_player_id, wins, losses, draws = row
+            
+        # Recompute the hash and compare in constant time
+        if not hmac.compare_digest(stored_hash, hash_password(password, salt)):
+            return {"status": "error", "message": "Incorrect password"}
+            
+        # Update player ID
+        self.db.execute("UPDATE users SET player_id = ? WHERE username = ?",
+                        (player_id, username))
+            
+        # Carry over stats from the previous session if it has any,
+        # otherwise fall back to the totals recorded at registration
+        prev = self.db.execute(
+            "SELECT wins, losses, draws FROM players WHERE player_id = ?",
+            (old_player_id,)).fetchone()
+        if prev is not None:
+            wins, losses, draws = prev
+        self.db.execute(
+            "INSERT OR REPLACE INTO players VALUES (?, ?, ?, ?, ?)",
+            (player_id, username, wins, losses, draws))
             
-            return {
-                "status": "success",
-                "message": f"Logged in as {username}",
-                "username": username
-            }
+        return {
+            "status": "success",
+            "message": f"Logged in as {username}",
+            "username": username
+        }
     
     def logout_user(self, message, player_id):
         """Logout the current user"""
@@ -613,18 +871,34 @@ class GameServer:
             "message": "Logged out successfully"
         }
     
+    def _open_recording(self, game_id):
+        """Open (or reopen) the append-only move log for a game"""
+        os.makedirs(self.recordings_dir, exist_ok=True)
+        recording_file = open(
+            os.path.join(self.recordings_dir, f"{game_id}.ndjson"),
+            "ab", buffering=64 * 1024)
+        self.recording_files[game_id] = recording_file
+        return recording_file
+    
     def list_recordings(self, message, player_id):
         """List available game recordings"""
         recordings_list = []
         
-        for game_id in self.recordings:
-            if game_id in self.games:
-                game = self.games[game_id]
-                recordings_list.append({
-                    "game_id": game_id,
-                    "created_at": game.get("created_at", "Unknown"),
-                    "players": [p["name"] for p in game.get("players", [])]
-                })
+        try:
+            filenames = os.listdir(self.recordings_dir)
+        except FileNotFoundError:
+            filenames = []
+        
+        for filename in filenames:
+            if not filename.endswith(".ndjson"):
+                continue
+            game_id = filename[:-len(".ndjson")]
+            game = self.games.get(game_id)
+            recordings_list.append({
+                "game_id": game_id,
+                "created_at": game.get("created_at", "Unknown") if game else "Unknown",
+                "players": [p["name"] for p in game.get("players", [])] if game else []
+            })
         
         return {
             "status": "success",
@@ -633,16 +907,28 @@ class GameServer:
         }
     
     def get_game_recording(self, message, player_id):
-        """Get a recording of a game"""
+        """Get a recording of a game, read back from its log file"""
         game_id = message.get('game_id')
         
-        if not game_id or game_id not in self.recordings:
+        if not game_id:
+            return {"status": "error", "message": "Recording not found"}
+        
+        # Push any buffered moves to disk before reading
+        recording_file = self.recording_files.get(game_id)
+        if recording_file is not None:
+            recording_file.flush()
+        
+        path = os.path.join(self.recordings_dir, f"{game_id}.ndjson")
+        try:
+            with open(path, "rb") as f:
+                recording = [decode_message(line) for line in f if line.strip()]
+        except FileNotFoundError:
             return {"status": "error", "message": "Recording not found"}
         
         return {
             "status": "success",
             "message": "Game recording retrieved",
-            "recording": self.recordings[game_id]
+            "recording": recording
         }
 
 def main():
@@ -658,13 +944,16 @@ def main():
     if len(sys.argv) > 2:
         port = int(sys.argv[2])
     
-    print(f"Starting Prospector server on {host}:{port}")
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    logger.info("Starting Prospector server on %s:%s", host, port)
     server = GameServer(host, port)
     
     try:
         server.start()
     except KeyboardInterrupt:
-        print("Server shutdown requested...")
+        logger.info("Server shutdown requested...")
         server.stop()
 
 if __name__ == "__main__":
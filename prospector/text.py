@@ -4,6 +4,7 @@ Test script for Prospector game
 """
 import sys
 import os
+import struct
 import time
 import threading
 import json
@@ -13,11 +14,36 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from server.server import GameServer
 from common.protocol import (
-    encode_message, decode_message,
+    encode_message, decode_message, HEADER_SIZE,
     create_game_message, join_game_message,
     place_fence_message, leave_game_message
 )
 
+def recv_message(sock, buf=None):
+    """Receive exactly one length-prefixed message from a socket
+
+    A caller-supplied bytearray is reused across messages, so payloads are
+    read in place with recv_into instead of allocating a fresh buffer each
+    time; it only grows when a payload is larger than the buffer.
+    """
+    header = b''
+    while len(header) < HEADER_SIZE:
+        chunk = sock.recv(HEADER_SIZE - len(header))
+        if not chunk:
+            raise ConnectionError("Connection closed while reading header")
+        header += chunk
+    (length,) = struct.unpack('>I', header)
+    if buf is None or len(buf) < length:
+        buf = bytearray(max(length, 65536))
+    view = memoryview(buf)[:length]
+    received = 0
+    while received < length:
+        n = sock.recv_into(view[received:])
+        if n == 0:
+            raise ConnectionError("Connection closed while reading payload")
+        received += n
+    return decode_message(view)
+
 def start_server():
     """Start the game server in a separate thread"""
     server = GameServer('127.0.0.1', 5556)
@@ -35,15 +61,15 @@ def simulate_client(actions, delay=0.5):
     client_socket.connect(('127.0.0.1', 5556))
     
     results = []
+    recv_buf = bytearray(65536)  # Reused for every response on this connection
     
     try:
         for action in actions:
             # Send action
-            client_socket.send(encode_message(action))
+            client_socket.sendall(encode_message(action))
             
             # Receive response
-            data = client_socket.recv(4096)
-            response = decode_message(data)
+            response = recv_message(client_socket, recv_buf)
             results.append(response)
             
             print(f"Action: {action}")